@@ -4,6 +4,7 @@ Avatar控制器 - 统一管理VRChat虚拟人物控制
 专注于VOICEVOX语音输出驱动的Avatar控制
 """
 
+import re
 from typing import Optional, Callable
 from .expression_mapper import ExpressionMapper
 from .character_manager import CharacterManager
@@ -11,6 +12,18 @@ from .avatar_parameters import AvatarParameters
 from .ai_character_manager import AICharacterManager
 
 
+# 文本情感关键词（按优先级排列），模块加载时编译为正则，每种情感只需一次C层扫描
+_TEXT_EMOTION_PATTERNS = tuple(
+    (emotion, re.compile('|'.join(map(re.escape, words))))
+    for emotion, words in (
+        ('happy', ('高兴', '开心', '快乐', '哈哈', '呵呵', '笑', '太好了')),     # 开心相关词汇
+        ('angry', ('生气', '愤怒', '气死', '讨厌', '烦')),                    # 生气相关词汇
+        ('sad', ('伤心', '难过', '哭', '悲伤', '失望')),                      # 悲伤相关词汇
+        ('surprise', ('惊讶', '震惊', '哇', '天啊', '不会吧')),               # 惊讶相关词汇
+    )
+)
+
+
 class AvatarController:
     """Avatar控制器主类"""
     
@@ -212,27 +225,13 @@ class AvatarController:
             str: 推测的情感类型
         """
         # 简单的关键词匹配，可以扩展为更复杂的情感分析
-        text_lower = text.lower()
-        
-        # 开心相关词汇
-        if any(word in text_lower for word in ['高兴', '开心', '快乐', '哈哈', '呵呵', '笑', '太好了']):
-            return 'happy'
-        
-        # 生气相关词汇
-        elif any(word in text_lower for word in ['生气', '愤怒', '气死', '讨厌', '烦']):
-            return 'angry'
-        
-        # 悲伤相关词汇
-        elif any(word in text_lower for word in ['伤心', '难过', '哭', '悲伤', '失望']):
-            return 'sad'
-        
-        # 惊讶相关词汇
-        elif any(word in text_lower for word in ['惊讶', '震惊', '哇', '天啊', '不会吧']):
-            return 'surprise'
+        # 关键词均为中文，无需先转小写
+        for emotion, pattern in _TEXT_EMOTION_PATTERNS:
+            if pattern.search(text):
+                return emotion
         
         # 默认中性
-        else:
-            return 'neutral'
+        return 'neutral'
     
     def speak_with_emotion(self, text: str, voice_level: float = 0.8) -> bool:
         """带情感的语音输出
@@ -6,8 +6,55 @@
 import json
 import os
 import math
+import threading
 from typing import Dict, List, Tuple, Optional, Callable
 
+import numpy as np
+
+# 可选依赖：安装了orjson时用它读写角色数据（C实现，更快），否则使用标准库json
+try:
+    import orjson
+    
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _json_loads = json.loads
+
+# 可选依赖：安装了numba时，角色数量很多的最近邻查询用单次遍历的JIT内核完成
+try:
+    import numba
+    
+    @numba.njit(cache=True)
+    def _nearest_k_kernel(positions, px, py, pz, k):
+        """一次遍历计算距离平方并维护按距离升序的前k个（不分配N长度的临时数组）"""
+        out_idx = np.full(k, -1, dtype=np.int64)
+        out_dist = np.full(k, np.inf)
+        for i in range(positions.shape[0]):
+            dx = positions[i, 0] - px
+            dy = positions[i, 1] - py
+            dz = positions[i, 2] - pz
+            d = dx * dx + dy * dy + dz * dz
+            if d < out_dist[k - 1]:
+                # 插入到有序的前k个中，距离相同时保持原有顺序
+                j = k - 1
+                while j > 0 and out_dist[j - 1] > d:
+                    out_dist[j] = out_dist[j - 1]
+                    out_idx[j] = out_idx[j - 1]
+                    j -= 1
+                out_dist[j] = d
+                out_idx[j] = i
+        return out_idx, np.sqrt(out_dist)
+except ImportError:
+    _nearest_k_kernel = None
+
+# 角色数量达到该值且距离尚未缓存时才使用JIT内核
+_NEAREST_K_KERNEL_MIN_CHARACTERS = 2048
+
 
 class CharacterManager:
     """角色管理器类"""
@@ -19,16 +66,51 @@ class CharacterManager:
             data_file: 角色数据存储文件路径
         """
         self.data_file = data_file
-        self.characters: Dict[str, Dict[str, float]] = {}  # {name: {"x": float, "y": float, "z": float}}
         self.player_position = {"x": 0.0, "y": 0.0, "z": 0.0}
         self.position_callbacks: List[Callable] = []  # 位置更新回调函数
         
+        # 角色数据按列存储：(名称列表, (N, 3) 坐标数组)，两者顺序一致。
+        # 每次修改都整体替换为新的元组和数组（写时复制），读取方拿到的快照不会被原地修改
+        self._store: Tuple[List[str], np.ndarray] = ([], np.empty((0, 3), dtype=np.float64))
+        self._name_to_index: Dict[str, int] = {}
+        # 距离缓存：(名称列表, 坐标数组, 距离数组)，角色或玩家位置变化时清空
+        self._distance_cache: Optional[Tuple[List[str], np.ndarray, np.ndarray]] = None
+        self._delta_buf = np.empty((0, 3), dtype=np.float64)  # 距离计算用的坐标差缓冲区，按角色数量复用
+        
+        # 延迟保存：连续修改在0.5秒内只写一次文件
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        
         # 创建数据目录
         os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
         
         # 加载已保存的角色数据
         self.load_characters()
     
+    @property
+    def characters(self) -> Dict[str, Dict[str, float]]:
+        """所有角色 {name: {"x": float, "y": float, "z": float}}（按需生成，修改它不影响存储）"""
+        names, positions = self._store
+        return {name: {"x": x, "y": y, "z": z} for name, (x, y, z) in zip(names, positions.tolist())}
+    
+    def _set_store(self, names: List[str], positions: np.ndarray):
+        """替换角色数据并重建名称索引、清空距离缓存"""
+        self._store = (names, positions)
+        self._name_to_index = {name: i for i, name in enumerate(names)}
+        self._distance_cache = None
+    
+    def _set_character(self, name: str, x: float, y: float, z: float):
+        """写入角色坐标（不存在则追加）"""
+        names, positions = self._store
+        row = np.array((x, y, z), dtype=np.float64)
+        index = self._name_to_index.get(name)
+        if index is None:
+            self._set_store(names + [name], np.vstack((positions, row)))
+        else:
+            positions = positions.copy()
+            positions[index] = row
+            self._set_store(names, positions)
+    
     def add_character(self, name: str, x: float, y: float, z: float) -> bool:
         """添加新角色
         
@@ -42,7 +124,7 @@ class CharacterManager:
         if not name.strip():
             return False
             
-        self.characters[name] = {"x": float(x), "y": float(y), "z": float(z)}
+        self._set_character(name, float(x), float(y), float(z))
         self.save_characters()
         return True
     
@@ -55,8 +137,10 @@ class CharacterManager:
         Returns:
             bool: 是否成功删除
         """
-        if name in self.characters:
-            del self.characters[name]
+        index = self._name_to_index.get(name)
+        if index is not None:
+            names, positions = self._store
+            self._set_store(names[:index] + names[index + 1:], np.delete(positions, index, axis=0))
             self.save_characters()
             return True
         return False
@@ -71,8 +155,8 @@ class CharacterManager:
         Returns:
             bool: 是否成功更新
         """
-        if name in self.characters:
-            self.characters[name] = {"x": float(x), "y": float(y), "z": float(z)}
+        if name in self._name_to_index:
+            self._set_character(name, float(x), float(y), float(z))
             self.save_characters()
             return True
         return False
@@ -84,6 +168,7 @@ class CharacterManager:
             x, y, z: 玩家坐标
         """
         self.player_position = {"x": float(x), "y": float(y), "z": float(z)}
+        self._distance_cache = None
         
         # 调用所有位置更新回调函数
         for callback in self.position_callbacks:
@@ -102,10 +187,42 @@ class CharacterManager:
         Returns:
             float: 3D距离
         """
-        dx = pos1['x'] - pos2['x']
-        dy = pos1['y'] - pos2['y']
-        dz = pos1['z'] - pos2['z']
-        return math.sqrt(dx*dx + dy*dy + dz*dz)
+        return self._dist3(pos1['x'], pos1['y'], pos1['z'], pos2['x'], pos2['y'], pos2['z'])
+    
+    @staticmethod
+    def _dist3(x1: float, y1: float, z1: float, x2: float, y2: float, z2: float, _sqrt=math.sqrt) -> float:
+        """计算两点间的3D距离（直接接收坐标，sqrt绑定为局部默认参数）"""
+        dx = x1 - x2
+        dy = y1 - y2
+        dz = z1 - z2
+        return _sqrt(dx*dx + dy*dy + dz*dz)
+    
+    def get_distance_snapshot(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """获取所有角色的名称、坐标和与玩家的距离（向量化计算并缓存）
+        
+        Returns:
+            Tuple[List[str], np.ndarray, np.ndarray]: (角色名列表, (N, 3) 坐标数组, (N,) 距离数组)，
+            三者按相同顺序排列，调用方不应修改
+        """
+        cache = self._distance_cache
+        if cache is not None:
+            return cache
+        
+        names, positions = self._store
+        player = self.player_position
+        
+        # 坐标差写入复用的缓冲区；距离数组会随快照返回给调用方，因此每次新建，再原地开方
+        deltas = self._delta_buf
+        if deltas.shape != positions.shape:
+            deltas = self._delta_buf = np.empty_like(positions)
+        np.subtract(positions, (player['x'], player['y'], player['z']), out=deltas)
+        distances = np.einsum('ij,ij->i', deltas, deltas)
+        np.sqrt(distances, out=distances)
+        cache = (names, positions, distances)
+        # 计算期间玩家位置或角色数据若已被其他线程更新，则不缓存这次结果
+        if self.player_position is player and self._store[1] is positions:
+            self._distance_cache = cache
+        return cache
     
     def get_character_distances(self) -> Dict[str, float]:
         """获取所有角色与玩家的距离
@@ -113,10 +230,8 @@ class CharacterManager:
         Returns:
             Dict[str, float]: 角色名称与距离的映射
         """
-        distances = {}
-        for name, pos in self.characters.items():
-            distances[name] = self.calculate_distance(self.player_position, pos)
-        return distances
+        names, _, distances = self.get_distance_snapshot()
+        return dict(zip(names, distances.tolist()))
     
     def get_nearest_characters(self, count: int = 3) -> List[Tuple[str, float]]:
         """获取最近的N个角色
@@ -127,9 +242,25 @@ class CharacterManager:
         Returns:
             List[Tuple[str, float]]: [(角色名, 距离), ...] 按距离排序
         """
-        distances = self.get_character_distances()
-        sorted_distances = sorted(distances.items(), key=lambda x: x[1])
-        return sorted_distances[:count]
+        if count <= 0:
+            return []
+        
+        names, positions = self._store
+        if (_nearest_k_kernel is not None and self._distance_cache is None
+                and count < len(names) and len(names) >= _NEAREST_K_KERNEL_MIN_CHARACTERS):
+            player = self.player_position
+            nearest, nearest_distances = _nearest_k_kernel(
+                positions, float(player['x']), float(player['y']), float(player['z']), count)
+            return [(names[i], d) for i, d in zip(nearest.tolist(), nearest_distances.tolist())]
+        
+        names, _, distances = self.get_distance_snapshot()
+        if count < len(distances):
+            # 先用argpartition以O(N)选出最近的count个，再只对这几个排序
+            nearest = np.argpartition(distances, count - 1)[:count]
+            order = nearest[np.argsort(distances[nearest], kind='stable')]
+        else:
+            order = np.argsort(distances, kind='stable')
+        return [(names[i], distances[i].item()) for i in order.tolist()]
     
     def get_characters_in_range(self, max_distance: float) -> List[Tuple[str, float]]:
         """获取指定范围内的角色
@@ -140,13 +271,14 @@ class CharacterManager:
         Returns:
             List[Tuple[str, float]]: [(角色名, 距离), ...]
         """
-        distances = self.get_character_distances()
-        in_range = [(name, dist) for name, dist in distances.items() if dist <= max_distance]
-        return sorted(in_range, key=lambda x: x[1])
+        names, _, distances = self.get_distance_snapshot()
+        in_range = np.flatnonzero(distances <= max_distance)
+        order = in_range[np.argsort(distances[in_range], kind='stable')]
+        return [(names[i], distances[i].item()) for i in order.tolist()]
     
     def get_all_characters(self) -> Dict[str, Dict[str, float]]:
         """获取所有角色信息"""
-        return self.characters.copy()
+        return self.characters
     
     def get_player_position(self) -> Dict[str, float]:
         """获取玩家当前位置"""
@@ -167,41 +299,59 @@ class CharacterManager:
             self.position_callbacks.remove(callback)
     
     def save_characters(self):
-        """保存角色数据到文件"""
+        """保存角色数据到文件（0.5秒内的多次调用合并为一次写入）"""
+        with self._save_lock:
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(0.5, self._flush_save)
+                self._save_timer.start()
+    
+    def _flush_save(self):
+        """立即把角色数据写入文件（先写临时文件再替换，避免写到一半的文件）"""
+        with self._save_lock:
+            self._save_timer = None
         try:
             data = {
                 'characters': self.characters,
                 'player_position': self.player_position,
                 'version': '1.0'
             }
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(data))
+            os.replace(tmp_file, self.data_file)
         except Exception as e:
             print(f"保存角色数据失败: {e}")
     
+    def _load_store(self, characters: Dict[str, Dict[str, float]]):
+        """从 {name: {"x", "y", "z"}} 字典批量填充按列存储的角色数据"""
+        names = list(characters)
+        coords = (float(pos[axis]) for pos in characters.values() for axis in ('x', 'y', 'z'))
+        positions = np.fromiter(coords, dtype=np.float64, count=3 * len(names)).reshape(-1, 3)
+        self._set_store(names, positions)
+    
     def load_characters(self):
         """从文件加载角色数据"""
         try:
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.characters = data.get('characters', {})
+                with open(self.data_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                    self._load_store(data.get('characters', {}))
                     self.player_position = data.get('player_position', {"x": 0.0, "y": 0.0, "z": 0.0})
             else:
                 # 创建空的数据文件
-                self.save_characters()
+                self._flush_save()
         except Exception as e:
             print(f"加载角色数据失败: {e}")
-            self.characters = {}
+            self._set_store([], np.empty((0, 3), dtype=np.float64))
             self.player_position = {"x": 0.0, "y": 0.0, "z": 0.0}
     
     def get_character_count(self) -> int:
         """获取角色数量"""
-        return len(self.characters)
+        return len(self._store[0])
     
     def character_exists(self, name: str) -> bool:
         """检查角色是否存在"""
-        return name in self.characters
+        return name in self._name_to_index
     
     def get_distance_info_text(self, max_characters: int = 5) -> str:
         """获取距离信息的文本表示
@@ -212,7 +362,7 @@ class CharacterManager:
         Returns:
             str: 格式化的距离信息文本
         """
-        if not self.characters:
+        if not self._name_to_index:
             return "暂无角色数据\n点击添加角色按钮开始"
         
         nearest = self.get_nearest_characters(max_characters)
@@ -193,19 +193,19 @@ class GPUFaceCamera:
     def get_frame_with_expressions(self) -> Tuple[Optional[np.ndarray], Dict[str, float]]:
         """获取带表情数据的帧"""
         if not self.cap or not self.cap.isOpened():
-            return None, {'angry': 0.0, 'disgust': 0.0, 'fear': 0.0, 'happy': 0.0, 'sad': 0.0, 'surprise': 0.0, 'neutral': 1.0}
+            return None, self.detector._get_default_expressions()
         
         try:
             ret, frame = self.cap.read()
             if not ret or frame is None:
-                return None, {'angry': 0.0, 'disgust': 0.0, 'fear': 0.0, 'happy': 0.0, 'sad': 0.0, 'surprise': 0.0, 'neutral': 1.0}
+                return None, self.detector._get_default_expressions()
             
             annotated_frame, expressions = self.detector.process_frame(frame)
             return annotated_frame, expressions
             
         except Exception as e:
             self.logger.error(f"获取帧时出错: {e}")
-            return None, {'angry': 0.0, 'disgust': 0.0, 'fear': 0.0, 'happy': 0.0, 'sad': 0.0, 'surprise': 0.0, 'neutral': 1.0}
+            return None, self.detector._get_default_expressions()
     
     def release(self):
         """释放资源"""
@@ -14,6 +14,14 @@ import logging
 import os
 from pathlib import Path
 
+# 叠加在画面上的表情参数显示名称
+EXPR_DISPLAY_NAMES = {
+    'eyeblink_left': 'L_Eye',
+    'eyeblink_right': 'R_Eye',
+    'mouth_open': 'Mouth',
+    'smile': 'Smile'
+}
+
 
 class LayerNorm(nn.Module):
     """LayerNorm支持两种数据格式: channels_last (default) or channels_first."""
@@ -173,6 +181,8 @@ class EmoNeXtDetector:
             'Surprise',  # 惊讶
             'Neutral'    # 中性
         ]
+        # 与emotion_labels顺序对应的表情键名
+        self._expression_keys = tuple(label.lower() for label in self.emotion_labels)
         
         # 面部检测器
         self.face_cascade = cv2.CascadeClassifier(
@@ -314,12 +324,9 @@ class EmoNeXtDetector:
     
     def _probabilities_to_expressions(self, probabilities):
         """将模型输出的概率分布转换为7种标准情感"""
-        expressions = {}
-        for i, emotion_label in enumerate(self.emotion_labels):
-            key = emotion_label.lower()  # 转换为小写作为键
-            expressions[key] = probabilities[i].item()
-        
-        return expressions
+        # 一次性拷贝到CPU，避免逐个元素调用item()
+        values = probabilities.detach().cpu().numpy().tolist()
+        return dict(zip(self._expression_keys, values))
     
     def _get_default_expressions(self):
         """获取默认表情参数 - 7种标准情感"""
@@ -355,17 +362,13 @@ class EmoNeXtDetector:
                 expressions, emotion_name, confidence = self.detect_emotion_single_face(face_roi)
                 
                 # 添加到历史记录并平滑处理
-                self.emotion_history.append(expressions)
+                self.emotion_history.append([expressions[key] for key in self._expression_keys])
                 if len(self.emotion_history) > self.history_size:
                     self.emotion_history.pop(0)
                 
-                # 计算平滑后的表情数据
-                smoothed_expressions = {}
-                for key in expressions.keys():
-                    values = [hist[key] for hist in self.emotion_history]
-                    smoothed_expressions[key] = np.mean(values)
-                
-                expressions = smoothed_expressions
+                # 计算平滑后的表情数据（按列一次求均值）
+                smoothed = np.mean(self.emotion_history, axis=0)
+                expressions = dict(zip(self._expression_keys, smoothed.tolist()))
                 
                 # 绘制面部框 (蓝色边框表示EmoNeXt)
                 cv2.rectangle(annotated_frame, (x, y), (x+w, y+h), (255, 0, 0), 2)
@@ -379,12 +382,7 @@ class EmoNeXtDetector:
                 y_offset = y + h + 20
                 for expr_name, value in expressions.items():
                     if value > 0.01:  # 只显示有值的表情
-                        display_name = {
-                            'eyeblink_left': 'L_Eye',
-                            'eyeblink_right': 'R_Eye',
-                            'mouth_open': 'Mouth', 
-                            'smile': 'Smile'
-                        }.get(expr_name, expr_name)
+                        display_name = EXPR_DISPLAY_NAMES.get(expr_name, expr_name)
                         
                         if expr_name == 'eyeblink_right':  # 避免重复显示眨眼
                             continue
@@ -14,6 +14,17 @@ import logging
 import os
 from pathlib import Path
 
+# 叠加在画面上的表情参数显示名称
+EXPR_DISPLAY_NAMES = {
+    'angry': 'Angry',
+    'disgust': 'Disgust',
+    'fear': 'Fear',
+    'happy': 'Happy',
+    'sad': 'Sad',
+    'surprise': 'Surprise',
+    'neutral': 'Neutral'
+}
+
 
 class BasicBlock(nn.Module):
     """ResNet基本块"""
@@ -126,6 +137,8 @@ class ResEmoteNetDetector:
             'Surprise',  # 惊讶
             'Neutral'    # 中性
         ]
+        # 与emotion_labels顺序对应的表情键名
+        self._expression_keys = tuple(label.lower() for label in self.emotion_labels)
         
         # 面部检测器
         self.face_cascade = cv2.CascadeClassifier(
@@ -257,12 +270,9 @@ class ResEmoteNetDetector:
     
     def _probabilities_to_expressions(self, probabilities):
         """将模型输出的概率分布转换为7种标准情感"""
-        expressions = {}
-        for i, emotion_label in enumerate(self.emotion_labels):
-            key = emotion_label.lower()  # 转换为小写作为键
-            expressions[key] = probabilities[i].item()
-        
-        return expressions
+        # 一次性拷贝到CPU，避免逐个元素调用item()
+        values = probabilities.detach().cpu().numpy().tolist()
+        return dict(zip(self._expression_keys, values))
     
     def _get_default_expressions(self):
         """获取默认表情参数 - 7种标准情感"""
@@ -298,17 +308,13 @@ class ResEmoteNetDetector:
                 expressions, emotion_name, confidence = self.detect_emotion_single_face(face_roi)
                 
                 # 添加到历史记录并平滑处理
-                self.emotion_history.append(expressions)
+                self.emotion_history.append([expressions[key] for key in self._expression_keys])
                 if len(self.emotion_history) > self.history_size:
                     self.emotion_history.pop(0)
                 
-                # 计算平滑后的表情数据
-                smoothed_expressions = {}
-                for key in expressions.keys():
-                    values = [hist[key] for hist in self.emotion_history]
-                    smoothed_expressions[key] = np.mean(values)
-                
-                expressions = smoothed_expressions
+                # 计算平滑后的表情数据（按列一次求均值）
+                smoothed = np.mean(self.emotion_history, axis=0)
+                expressions = dict(zip(self._expression_keys, smoothed.tolist()))
                 
                 # 绘制面部框
                 cv2.rectangle(annotated_frame, (x, y), (x+w, y+h), (0, 255, 0), 2)
@@ -322,15 +328,7 @@ class ResEmoteNetDetector:
                 y_offset = y + h + 20
                 for expr_name, value in expressions.items():
                     if value > 0.05:  # 只显示有显著值的情感
-                        display_name = {
-                            'angry': 'Angry',
-                            'disgust': 'Disgust', 
-                            'fear': 'Fear',
-                            'happy': 'Happy',
-                            'sad': 'Sad',
-                            'surprise': 'Surprise',
-                            'neutral': 'Neutral'
-                        }.get(expr_name, expr_name)
+                        display_name = EXPR_DISPLAY_NAMES.get(expr_name, expr_name)
                         
                         text = f"{display_name}: {value:.2f}"
                         cv2.putText(annotated_frame, text, (x, y_offset), 
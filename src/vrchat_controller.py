@@ -370,6 +370,14 @@ class VRChatController:
             
         return debug_info
     
+    def get_full_status_snapshot(self) -> dict:
+        """一次性获取状态、调试信息和VRChat连接诊断"""
+        return {
+            "status": self.get_status(),
+            "debug": self.get_debug_info(),
+            "diagnosis": self.osc_client.get_vrchat_connection_diagnosis()
+        }
+    
     def cleanup(self):
         """清理资源"""
         self.stop_voice_listening()
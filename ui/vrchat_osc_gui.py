@@ -7,7 +7,11 @@ VRChat OSC Client GUI
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import threading
+import concurrent.futures
+import collections
+import functools
 import time
+import json
 import sys
 import os
 import numpy as np
@@ -28,9 +32,105 @@ from src.avatar import AvatarController
 from src.avatar.single_ai_vrc_manager import SingleAIVRCManager
 
 
+# 7种标准情感的显示名称
+EXPR_DISPLAY_NAMES = {
+    'angry': '愤怒',
+    'disgust': '厌恶',
+    'fear': '恐惧',
+    'happy': '高兴',
+    'sad': '伤心',
+    'surprise': '惊讶',
+    'neutral': '中立'
+}
+
+# 情感键的固定顺序，以及对应的VRChat OSC参数地址（启动时计算一次）
+EXPR_KEYS = tuple(EXPR_DISPLAY_NAMES)
+VRCHAT_EXPR_PARAMS = {name: f'/avatar/parameters/Face{name.capitalize()}' for name in EXPR_KEYS}
+VRCHAT_EXPR_ADDRESSES = tuple(VRCHAT_EXPR_PARAMS.values())
+
+
+def _expression_array(expressions):
+    """按EXPR_KEYS顺序把表情字典转为float32数组，缺失的键视为0"""
+    return np.fromiter((expressions.get(k, 0.0) for k in EXPR_KEYS), dtype=np.float32, count=len(EXPR_KEYS))
+
+# YuNet面部检测模型（OpenCV Zoo），文件存在时替代Haar级联检测
+YUNET_MODEL_PATH = os.path.join("models", "yunet", "face_detection_yunet_2023mar.onnx")
+YUNET_SCORE_THRESHOLD = 0.8  # YuNet检测结果的最低置信度
+
+# 参数值中的布尔字面量（小写）
+PARAM_BOOL_LITERALS = {'true': True, 'false': False}
+
+# 语音队列各状态在队列显示中的图标
+VOICE_QUEUE_STATUS_SYMBOLS = {
+    "pending": "⏳",
+    "processing": "🔄",
+    "completed": "✅",
+    "error": "❌"
+}
+
+
+def require_connected(reset_var=None):
+    """装饰器：未连接VRChat时提示并跳过操作，可选地将指定的复选框变量重置为False"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not self.is_connected:
+                messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
+                if reset_var:
+                    getattr(self, reset_var).set(False)
+                return
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
 class VRChatOSCGUI:
     """VRChat OSC GUI界面类"""
     
+    # 切换语言时需要更新文本的组件：(属性名, 文本键)
+    _LANG_BINDINGS = (
+        # 界面框架标题
+        ('connection_frame', 'connection_settings'),
+        ('message_frame', 'message_send'),
+        ('param_frame', 'avatar_params'),
+        ('log_frame', 'log'),
+        ('speech_frame', 'speech_output'),
+        ('camera_control_frame', 'camera_control'),
+        ('camera_display_frame', 'camera_feed'),
+        ('expression_frame', 'realtime_expression'),
+        # 标签
+        ('text_message_label', 'text_message'),
+        ('recognition_language_label', 'recognition_language'),
+        ('compute_device_label', 'compute_device'),
+        ('voice_threshold_label', 'voice_threshold'),
+        ('param_name_label', 'param_name'),
+        ('param_value_label', 'param_value'),
+        ('camera_label', 'camera'),
+        ('model_label', 'model'),
+        # 按钮和复选框
+        ('advanced_settings_btn', 'advanced_settings'),
+        ('fallback_check', 'force_fallback_mode'),
+        ('disable_fallback_check', 'disable_fallback_mode'),
+        ('save_expression_btn', 'save_expression'),
+        ('voicevox_test_btn', 'voice_test'),
+        ('send_text_btn', 'send_text'),
+        ('upload_voice_btn', 'upload_voice'),
+        ('record_voice_btn', 'record_voice'),
+        ('debug_check', 'debug'),
+        ('status_btn', 'show_status'),
+        ('camera_btn', 'camera_window'),
+        ('settings_btn', 'settings'),
+        ('send_param_btn', 'send_param'),
+        ('add_character_btn', 'add_character'),
+        ('remove_character_btn', 'remove_character'),
+        ('use_current_pos_btn', 'update_position'),
+        ('clear_log_btn', 'clear_log'),
+        ('clear_speech_btn', 'clear_speech'),
+        ('save_speech_btn', 'save_speech'),
+        ('refresh_btn', 'refresh'),
+        ('capture_btn', 'screenshot'),
+    )
+    
     def __init__(self):
         # 加载配置
         self.config = config_manager
@@ -45,11 +145,26 @@ class VRChatOSCGUI:
         self.root.geometry(window_size)
         self.root.resizable(True, True)
         
+        # 预定义状态标签样式，切换状态时只需更换样式名
+        style = ttk.Style(self.root)
+        style.configure('Status.Connected.TLabel', foreground='green')
+        style.configure('Status.Disconnected.TLabel', foreground='red')
+        style.configure('Status.Pending.TLabel', foreground='orange')
+        style.configure('Status.Info.TLabel', foreground='blue')
+        
         # OSC客户端
         self.client = None
         self.is_connected = False
         self.is_listening = False
         
+        # 后台IO线程池（连接VRChat、加载模型等阻塞操作），重连时复用
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix='vrc-io')
+        self._closing = threading.Event()  # 窗口关闭后置位，后台任务不再回调界面
+        self._connect_future = None
+        self._last_applied = {}  # 已应用到客户端的设置 {设置方法名: 值}
+        # 音频文件识别使用单个常驻线程，按提交顺序依次识别
+        self._asr_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='asr')
+        
         # 从配置文件加载设置变量
         self.host_var = tk.StringVar(value=self.config.osc_host)
         self.send_port_var = tk.StringVar(value=str(self.config.osc_send_port))
@@ -57,9 +172,9 @@ class VRChatOSCGUI:
         self.language_var = tk.StringVar(value=self.config.voice_language)
         self.device_var = tk.StringVar(value=self.config.voice_device)
         self.ui_language = tk.StringVar(value=self.config.ui_language)  # 界面语言：zh=中文, ja=日语
+        self._text_cache = {}  # 当前语言的文本缓存
         
         # 语音文件相关变量
-        self.uploaded_audio_data = None
         self.uploaded_audio_sample_rate = None
         self.uploaded_filename = None
         
@@ -69,35 +184,121 @@ class VRChatOSCGUI:
         self.face_detection_running = False
         self.current_frame = None
         self.camera_thread = None
-        
+        self._pending_image = None  # 等待主线程显示的最新画面
+        self._video_pump_id = None
+        self._face_cascade = None  # Haar面部检测器，首次使用时加载
+        self._use_opencl = False  # 是否通过OpenCL（UMat）运行面部检测，加载检测器时确定
+        self._yunet = None  # YuNet面部检测器（None: 未加载, False: 模型不可用）
+        self._small_bgr_buf = None  # YuNet检测用的缩小彩色图缓冲区
+        self._last_face_error_time = float('-inf')  # 上次记录面部识别错误的时间（time.monotonic）
+        self._last_ai_send_time = float('-inf')  # 上次发送AI文本消息的时间（time.monotonic）
+        self._gray_buf = None  # 面部检测用的灰度图缓冲区
+        self._small_gray_buf = None  # 缩小后的灰度图缓冲区
+        self._detect_every_n = 3  # 每N帧进行一次完整识别，其余帧复用上次结果
+        self._detect_frame_idx = 0
+        self._last_detection = None  # 上次识别的 (标注像素掩码, 标注后的画面)
+        # 面部识别单独在一个工作线程中进行，忙时丢弃新帧
+        self._detect_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='vrc-face')
+        self._detect_future = None
+
+        # 表情显示刷新合并（避免每帧都重绘进度条）
+        self._pending_expr = None
+        self._expr_flush_scheduled = False
+        self._expr_flush_costs = collections.deque(maxlen=30)  # 最近的表情刷新耗时（秒）
+        self._expr_flush_delay = 33  # 下次刷新的调度延迟（毫秒），目标约30FPS
+        self._last_expr_values = {}
+        self._last_sent_expr = None  # 最近一次发送到VRChat的表情值（按EXPR_KEYS顺序），None表示尚未发送
+        # 预先生成整体状态文本模板，避免每帧重复拼接
+        self._overall_status_fmt = {name: f"{display} ({{:.2f}})" for name, display in EXPR_DISPLAY_NAMES.items()}
+
         # Avatar控制器 - 统一管理虚拟人物控制
         self.avatar_controller = AvatarController(character_data_file="data/vrc_characters.json")
         
         # 单AI角色VRC管理器
         self.single_ai_manager = None  # 延迟初始化，等待VOICEVOX连接
+        self._queue_shadow = []  # 语音队列当前显示的各行内容
+        self._queue_items_key = None  # 上次显示时队列项的(状态, 时间, 文本)
+        self.ai_voice_queue_text = None  # 语音队列文本控件，未创建时为None
         
         # 为了兼容性保留的变量（逐步迁移到avatar_controller）
         self.character_window = None  # 角色管理窗口引用
+        self.character_listbox = None  # 角色管理窗口中的控件，窗口创建后才存在
+        self.position_label = None
+        self.current_pos_label = None  # 主界面控件，界面创建前为None
+        self.character_distance_text = None
+        self.active_ai_label = None
+        self.activate_ai_btn = None
         self.camera_id_mapping = {}  # 摄像头显示名称到ID的映射
         self.emotion_model_type = 'ResEmoteNet'  # 默认使用ResEmoteNet情感识别模型
         
         # VOICEVOX相关变量
         self.voicevox_client = None
         self.voicevox_connected = False
+        self._stop_speak_after_id = None  # 唯一的"停止说话"定时器，新语音到来时重新调度
+        self._speakers_by_display = {}  # 角色显示名称到角色信息的映射，连接成功时生成
+        self._position_refresh_pending = False  # 是否已调度玩家位置相关的界面刷新
+        self._last_ai_status = None  # AI角色状态区域上次显示的内容
+        self._after_ids = {}  # 防抖刷新的定时器，按用途区分
+        self._pending_voice_params = {}  # 滑块拖动中尚未应用的语音参数
+        self._voice_params_after_id = None
         
         # LLM相关变量
         self.llm_handler = None
         self.llm_enabled = True
         
+        # 日志和语音输出的UI更新队列，由主线程定时统一处理
+        # 日志只保留最近的部分；语音识别结果单独排队，不会被大量日志挤掉
+        self._log_queue = collections.deque(maxlen=2000)
+        self._speech_queue = collections.deque()
+        self._ts_cache = (0, '')  # (秒, 格式化后的时间戳)
+        self._ui_visible = True  # 主窗口是否可见（最小化时跳过界面刷新）
+        
+        # 输入框回车提交统一由一个类绑定分发
+        self.root.bind_class('SubmitOnReturn', '<Return>', self._on_submit_return)
         
         self.setup_ui()
         
+        # AI角色控制控件在界面创建后解析一次，切换启用状态时直接遍历
+        self._ai_controls = tuple(
+            control for control in (
+                getattr(self, name, None) for name in (
+                    'ai_greet_btn', 'ai_speak_btn', 'ai_speak_entry',
+                    'ai_send_text_btn', 'ai_text_entry',
+                    'ai_upload_voice_btn', 'ai_voicevox_generate_btn', 'ai_voicevox_text_entry'
+                )
+            ) if control is not None and hasattr(control, 'config')
+        )
+        
+        # 跟踪主窗口最小化状态
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
+        
+        # 启动UI队列处理
+        self.root.after(50, self._drain_ui_queue)
+        
         # 绑定窗口关闭事件
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def get_text(self, key):
-        """获取当前语言的文本"""
-        return get_text(self.ui_language.get(), key, key)
+        """获取当前语言的文本（按键缓存，切换语言时清空）"""
+        try:
+            return self._text_cache[key]
+        except KeyError:
+            text = get_text(self.ui_language.get(), key, key)
+            self._text_cache[key] = text
+            return text
+    
+    def _bind_submit(self, entry, handler):
+        """设置输入框按回车时调用的处理函数"""
+        entry._submit_handler = handler
+        if 'SubmitOnReturn' not in entry.bindtags():
+            entry.bindtags(entry.bindtags() + ('SubmitOnReturn',))
+    
+    def _on_submit_return(self, event):
+        """回车提交分发"""
+        handler = getattr(event.widget, '_submit_handler', None)
+        if handler:
+            handler()
     
     def setup_ui(self):
         """设置用户界面"""
@@ -197,7 +398,7 @@ class VRChatOSCGUI:
         
         self.message_entry = ttk.Entry(text_frame, font=("", 10))
         self.message_entry.grid(row=0, column=0, sticky=(tk.W, tk.E), padx=(0, 5))
-        self.message_entry.bind("<Return>", lambda e: self.send_text_message())
+        self._bind_submit(self.message_entry, self.send_text_message)
         
         self.send_text_btn = ttk.Button(text_frame, text=self.get_text("send_text"), command=self.send_text_message)
         self.send_text_btn.grid(row=0, column=1)
@@ -312,7 +513,7 @@ class VRChatOSCGUI:
         self.param_value_label.grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
         self.param_value_entry = ttk.Entry(self.param_frame, width=15)
         self.param_value_entry.grid(row=0, column=3, sticky=(tk.W, tk.E), padx=(0, 10))
-        self.param_value_entry.bind("<Return>", lambda e: self.send_parameter())
+        self._bind_submit(self.param_value_entry, self.send_parameter)
         
         # 发送参数按钮
         self.send_param_btn = ttk.Button(self.param_frame, text=self.get_text("send_param"), command=self.send_parameter)
@@ -327,8 +528,9 @@ class VRChatOSCGUI:
         # 配置左侧框架行权重
         left_frame.rowconfigure(3, weight=1)
         
-        # 日志文本框 - 减小高度为语音识别框让出空间
-        self.log_text = scrolledtext.ScrolledText(self.log_frame, height=10, font=("Consolas", 9))
+        # 日志文本框 - 减小高度为语音识别框让出空间（只追加显示，关闭撤销记录）
+        self.log_text = scrolledtext.ScrolledText(self.log_frame, height=10, font=("Consolas", 9),
+                                                  undo=False, autoseparators=False, maxundo=0)
         self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 清空日志按钮
@@ -346,7 +548,8 @@ class VRChatOSCGUI:
         center_frame.rowconfigure(4, weight=3)  # 语音识别框更大权重
         
         # 语音识别文本框
-        self.speech_text = scrolledtext.ScrolledText(self.speech_frame, height=8, font=("", 12), wrap=tk.WORD)
+        self.speech_text = scrolledtext.ScrolledText(self.speech_frame, height=8, font=("", 12), wrap=tk.WORD,
+                                                     undo=False, autoseparators=False, maxundo=0)
         self.speech_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # 配置语音识别输出的颜色标签
@@ -379,7 +582,7 @@ class VRChatOSCGUI:
         status_frame.grid(row=1, column=0, columnspan=3, sticky=(tk.W, tk.E))
         status_frame.columnconfigure(0, weight=1)
         
-        self.status_label = ttk.Label(status_frame, text=self.get_text("disconnected"), foreground="red")
+        self.status_label = ttk.Label(status_frame, text=self.get_text("disconnected"), style="Status.Disconnected.TLabel")
         self.status_label.grid(row=0, column=0, sticky=tk.W)
         
         # 进度条（默认隐藏）
@@ -446,29 +649,28 @@ class VRChatOSCGUI:
             # 显示检测状态
             self.camera_combo['values'] = ['正在检测...']
             self.camera_combo.set('正在检测...')
-            self.root.update()
             
-            # 在后台线程中检测摄像头
-            def detect_cameras():
-                try:
-                    available_cameras = self.detect_available_cameras()
-                    
-                    # 在主线程中更新UI
-                    self.root.after(0, lambda: self.update_camera_list(available_cameras))
-                    
-                except Exception as e:
-                    self.root.after(0, lambda: self.log(f"检测摄像头失败: {e}"))
-            
-            # 启动检测线程
-            import threading
-            thread = threading.Thread(target=detect_cameras, daemon=True)
-            thread.start()
+            # 在后台线程池中检测摄像头，完成后回到主线程更新UI
+            future = self._io_pool.submit(self.detect_available_cameras)
+            future.add_done_callback(lambda future: self._post_to_ui(self._on_cameras_detected, future))
             
         except Exception as e:
             self.log(f"刷新摄像头列表失败: {e}")
             self.camera_combo['values'] = ['检测失败']
             self.camera_combo.set('检测失败')
     
+    def _on_cameras_detected(self, future):
+        """摄像头检测完成（在主线程中调用）"""
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None:
+            self.log(f"检测摄像头失败: {error}")
+            return
+        
+        self.update_camera_list(future.result())
+    
     def update_camera_list(self, available_cameras):
         """更新摄像头列表（在主线程中调用）"""
         try:
@@ -560,7 +762,7 @@ class VRChatOSCGUI:
         
         
         # VOICEVOX连接状态
-        self.voicevox_status_label = ttk.Label(character_frame, text=self.get_text("disconnected"), foreground="red")
+        self.voicevox_status_label = ttk.Label(character_frame, text=self.get_text("disconnected"), style="Status.Disconnected.TLabel")
         self.voicevox_status_label.pack(side=tk.RIGHT)
         
         # 第三行：控制按钮
@@ -680,10 +882,26 @@ class VRChatOSCGUI:
         
         # 设置AI角色管理界面
         self.setup_ai_character_interface(ai_frame)
-        
-        # 设置位置标记界面（原来的功能）
-        self.setup_position_marker_interface(position_frame)
-    
+
+        # 位置标记界面（原来的功能）在首次切换到该选项卡时再构建
+        self._position_frame = position_frame
+        self._position_tab_built = False
+        character_notebook.bind("<<NotebookTabChanged>>", self._on_char_tab_changed)
+
+    def _on_char_tab_changed(self, event):
+        """角色管理选项卡切换事件，延迟构建位置标记界面"""
+        notebook = event.widget
+        if self._position_tab_built or notebook.index("current") != 1:
+            return
+
+        self._position_tab_built = True
+        self.setup_position_marker_interface(self._position_frame)
+
+        # 补上构建前错过的位置和距离显示
+        current_pos = self.avatar_controller.get_player_position()
+        self.current_pos_label.config(text=f"({current_pos['x']:.2f}, {current_pos['y']:.2f}, {current_pos['z']:.2f})")
+        self.update_character_distance_display()
+
     def setup_ai_character_interface(self, parent_frame):
         """设置VRC连接和人物控制界面"""
         # AI场景选择区域
@@ -820,7 +1038,7 @@ class VRChatOSCGUI:
         
         # OSC连接状态和控制
         ttk.Label(button_frame, text="连接状态:", width=8).pack(side=tk.LEFT, padx=(0, 2))
-        self.ai_osc_status_label = ttk.Label(button_frame, text="未连接", foreground="red", width=6)
+        self.ai_osc_status_label = ttk.Label(button_frame, text="未连接", style="Status.Disconnected.TLabel", width=6)
         self.ai_osc_status_label.pack(side=tk.LEFT, padx=(0, 5))
         
         self.ai_osc_connect_btn = ttk.Button(button_frame, text="连接VRC", command=self.toggle_ai_osc_connection, width=8)
@@ -840,7 +1058,7 @@ class VRChatOSCGUI:
         ttk.Label(text_message_row, text="发送文本:", width=8).pack(side=tk.LEFT)
         self.ai_text_entry = ttk.Entry(text_message_row)
         self.ai_text_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        self.ai_text_entry.bind("<Return>", lambda e: self.ai_send_text_message())
+        self._bind_submit(self.ai_text_entry, self.ai_send_text_message)
         
         self.ai_send_text_btn = ttk.Button(text_message_row, text="发送", command=self.ai_send_text_message, width=6)
         self.ai_send_text_btn.pack(side=tk.LEFT)
@@ -865,7 +1083,11 @@ class VRChatOSCGUI:
         ttk.Label(voicevox_control_row, text="内容:", width=5).pack(side=tk.LEFT)
         self.ai_voicevox_text_entry = ttk.Entry(voicevox_control_row)
         self.ai_voicevox_text_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 5))
-        self.ai_voicevox_text_entry.bind("<Return>", lambda e: self.ai_generate_and_send_voice())
+        self._bind_submit(self.ai_voicevox_text_entry, self.ai_generate_and_send_voice)
+        
+        # 发送结果提示（不弹窗，几秒后自动清除）
+        self.ai_message_status_label = ttk.Label(vrc_message_frame, text="", style="Status.Connected.TLabel")
+        self.ai_message_status_label.pack(fill=tk.X, pady=(5, 0))
         
         # 初始化状态
         self.init_movement_controls()
@@ -878,7 +1100,7 @@ class VRChatOSCGUI:
         pos_frame.pack(fill=tk.X, pady=(0, 5))
         
         ttk.Label(pos_frame, text=self.get_text("character_position") + ":", width=8).pack(side=tk.LEFT)
-        self.current_pos_label = ttk.Label(pos_frame, text="(0.00, 0.00, 0.00)", foreground="blue")
+        self.current_pos_label = ttk.Label(pos_frame, text="(0.00, 0.00, 0.00)", style="Status.Info.TLabel")
         self.current_pos_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # 位置标记添加区域
@@ -927,7 +1149,8 @@ class VRChatOSCGUI:
         list_frame.rowconfigure(0, weight=1)
         
         # 位置标记距离显示列表
-        self.character_distance_text = tk.Text(list_frame, height=6, width=35, state='disabled', wrap=tk.WORD)
+        self.character_distance_text = tk.Text(list_frame, height=6, width=35, state='disabled', wrap=tk.WORD,
+                                               undo=False, autoseparators=False, maxundo=0)
         scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.character_distance_text.yview)
         self.character_distance_text.configure(yscrollcommand=scrollbar.set)
         
@@ -946,124 +1169,119 @@ class VRChatOSCGUI:
 
     def setup_camera_area(self, parent_frame):
         """设置摄像头区域"""
+        # 先创建全部组件，最后统一执行一次布局，避免构建过程中反复触发几何计算
+        layout = []
+        
         # 摄像头控制面板
         self.camera_control_frame = ttk.LabelFrame(parent_frame, text=self.get_text("camera_control"), padding="5")
-        self.camera_control_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        layout.append((self.camera_control_frame, 'grid', dict(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))))
         self.camera_control_frame.columnconfigure(0, weight=1)
         
         # 摄像头控制按钮
         control_buttons = ttk.Frame(self.camera_control_frame)
-        control_buttons.pack(fill=tk.X, pady=5)
+        layout.append((control_buttons, 'pack', dict(fill=tk.X, pady=5)))
         
         # 摄像头选择
         self.camera_label = ttk.Label(control_buttons, text=self.get_text("camera"))
-        self.camera_label.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.camera_label, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         self.camera_id_var = tk.StringVar(value="0")
         self.camera_combo = ttk.Combobox(control_buttons, textvariable=self.camera_id_var, 
                                         width=15, state="readonly")
-        self.camera_combo.pack(side=tk.LEFT, padx=(0, 10))
+        layout.append((self.camera_combo, 'pack', dict(side=tk.LEFT, padx=(0, 10))))
         
         # 模型选择
         self.model_label = ttk.Label(control_buttons, text=self.get_text("model"))
-        self.model_label.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.model_label, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         self.model_var = tk.StringVar(value="ResEmoteNet")
         self.model_combo = ttk.Combobox(control_buttons, textvariable=self.model_var,
                                   values=["Simple", "ResEmoteNet", "FER2013", "EmoNeXt"], 
                                   width=12, state="readonly")
-        self.model_combo.pack(side=tk.LEFT, padx=(0, 10))
+        layout.append((self.model_combo, 'pack', dict(side=tk.LEFT, padx=(0, 10))))
         self.model_combo.bind("<<ComboboxSelected>>", self.on_model_changed)
         
         # 刷新摄像头列表按钮
         self.refresh_btn = ttk.Button(control_buttons, text=self.get_text("refresh"), command=self.refresh_camera_list)
-        self.refresh_btn.pack(side=tk.LEFT, padx=(0, 5))
-        
-        # 初始化摄像头列表
-        self.refresh_camera_list()
+        layout.append((self.refresh_btn, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         
         # 摄像头启动/停止按钮
         self.camera_start_btn = ttk.Button(control_buttons, text=self.get_text("start_camera"), command=self.toggle_camera_only)
-        self.camera_start_btn.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.camera_start_btn, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         
         # 面部识别启动/停止按钮  
         self.face_detection_btn = ttk.Button(control_buttons, text=self.get_text("start_face_detection"), 
                                            command=self.toggle_face_detection, state="disabled")
-        self.face_detection_btn.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.face_detection_btn, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         
         # 截图按钮
         self.capture_btn = ttk.Button(control_buttons, text=self.get_text("screenshot"), command=self.capture_screenshot, 
                                      state="disabled")
-        self.capture_btn.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.capture_btn, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         
         # 保存表情数据按钮
         self.save_expression_btn = ttk.Button(control_buttons, text=self.get_text("save_expression"), command=self.save_expression_data,
                                             state="disabled")
-        self.save_expression_btn.pack(side=tk.LEFT, padx=(0, 5))
+        layout.append((self.save_expression_btn, 'pack', dict(side=tk.LEFT, padx=(0, 5))))
         
         # 摄像头显示区域
         self.camera_display_frame = ttk.LabelFrame(parent_frame, text=self.get_text("camera_feed"), padding="5")
-        self.camera_display_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        layout.append((self.camera_display_frame, 'grid', dict(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))))
         self.camera_display_frame.columnconfigure(0, weight=1)
         self.camera_display_frame.rowconfigure(0, weight=1)
         
-        # 视频显示标签 - 设置固定尺寸和样式
-        self.video_label = tk.Label(self.camera_display_frame, text=self.get_text("click_to_start"), 
-                                   bg="black", fg="white",
-                                   font=("Arial", 12),
-                                   width=80, height=30)  # 设置足够的显示空间
-        self.video_label.pack(expand=True, fill=tk.BOTH, padx=5, pady=5)
+        # 视频显示画布 - 只保留一个图像项，每帧直接粘贴像素到同一个PhotoImage
+        self.video_canvas = tk.Canvas(self.camera_display_frame, bg="black", highlightthickness=0,
+                                      width=640, height=480)
+        self._video_photo = None
+        self._video_shown = False
+        self._video_item = self.video_canvas.create_image(0, 0, anchor=tk.NW, state=tk.HIDDEN)
+        self._video_text_item = self.video_canvas.create_text(320, 240, text=self.get_text("click_to_start"),
+                                                              fill="white", font=("Arial", 12))
+        layout.append((self.video_canvas, 'pack', dict(expand=True, fill=tk.BOTH, padx=5, pady=5)))
         
         # 表情数据显示区域
         self.expression_frame = ttk.LabelFrame(parent_frame, text=self.get_text("realtime_expression"), padding="5")
-        self.expression_frame.grid(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        layout.append((self.expression_frame, 'grid', dict(row=2, column=0, sticky=(tk.W, tk.E), pady=(0, 10))))
         # 配置表情框架的列权重，避免重叠 - 每列占用3个网格位置
         self.expression_frame.columnconfigure(2, weight=1)  # 第一列进度条
         self.expression_frame.columnconfigure(5, weight=1)  # 第二列进度条
         
         # 表情数据标签 - 7种标准情感
-        self.expressions = {
-            'angry': 0.0,      # 愤怒
-            'disgust': 0.0,    # 厌恶
-            'fear': 0.0,       # 恐惧
-            'happy': 0.0,      # 高兴
-            'sad': 0.0,        # 伤心
-            'surprise': 0.0,   # 惊讶
-            'neutral': 0.0     # 中立
-        }
+        self.expressions = dict.fromkeys(EXPR_KEYS, 0.0)
         
         # 创建表情显示组件
         row = 0
         col = 0
         self.expression_labels = {}
         self.expression_progress_bars = {}
+        self.expression_vars = {}        # 进度条绑定的变量
+        self.expression_text_vars = {}   # 数值标签绑定的变量
+        self.expression_name_labels = {}  # 表情名称标签
         
         for expr_name in self.expressions.keys():
             # 表情名称
-            display_name = {
-                'angry': '愤怒',
-                'disgust': '厌恶',
-                'fear': '恐惧', 
-                'happy': '高兴',
-                'sad': '伤心',
-                'surprise': '惊讶',
-                'neutral': '中立'
-            }.get(expr_name, expr_name)
+            display_name = EXPR_DISPLAY_NAMES[expr_name]
             
             # 使用正确的列偏移避免重叠：每列占用3个位置
             base_col = col * 3
             
-            ttk.Label(self.expression_frame, text=f"{display_name}:").grid(
-                row=row, column=base_col, sticky=tk.W, padx=(0, 5))
+            name_label = ttk.Label(self.expression_frame, text=f"{display_name}:")
+            layout.append((name_label, 'grid', dict(row=row, column=base_col, sticky=tk.W, padx=(0, 5))))
+            self.expression_name_labels[expr_name] = name_label
             
-            # 数值显示
-            value_label = ttk.Label(self.expression_frame, text="0.00", width=6)
-            value_label.grid(row=row, column=base_col+1, sticky=tk.W, padx=(0, 5))
+            # 数值显示（绑定StringVar，由Tcl变量跟踪统一刷新）
+            value_var = tk.StringVar(value="0.00")
+            value_label = ttk.Label(self.expression_frame, textvariable=value_var, width=6)
+            layout.append((value_label, 'grid', dict(row=row, column=base_col+1, sticky=tk.W, padx=(0, 5))))
             self.expression_labels[expr_name] = value_label
+            self.expression_text_vars[expr_name] = value_var
             
-            # 进度条
-            progress = ttk.Progressbar(self.expression_frame, length=120, mode='determinate')
-            progress.grid(row=row, column=base_col+2, sticky=(tk.W, tk.E), padx=(0, 15))
-            progress['maximum'] = 100
+            # 进度条（绑定DoubleVar）
+            progress_var = tk.DoubleVar(value=0.0)
+            progress = ttk.Progressbar(self.expression_frame, length=120, mode='determinate',
+                                       maximum=100, variable=progress_var)
+            layout.append((progress, 'grid', dict(row=row, column=base_col+2, sticky=(tk.W, tk.E), padx=(0, 15))))
             self.expression_progress_bars[expr_name] = progress
+            self.expression_vars[expr_name] = progress_var
             
             col += 1
             if col >= 2:
@@ -1073,31 +1291,111 @@ class VRChatOSCGUI:
         # 添加分隔线和整体状态显示
         row += 1
         separator = ttk.Separator(self.expression_frame, orient='horizontal')
-        separator.grid(row=row, column=0, columnspan=6, sticky=(tk.W, tk.E), pady=(10, 5))
+        layout.append((separator, 'grid', dict(row=row, column=0, columnspan=6, sticky=(tk.W, tk.E), pady=(10, 5))))
         
         row += 1
         # 整体情感状态显示
-        ttk.Label(self.expression_frame, text="整体状态:").grid(
-            row=row, column=0, sticky=tk.W, padx=(0, 5))
+        self.overall_name_label = ttk.Label(self.expression_frame, text="整体状态:")
+        layout.append((self.overall_name_label, 'grid', dict(row=row, column=0, sticky=tk.W, padx=(0, 5))))
         
         self.overall_status_label = ttk.Label(self.expression_frame, text="中立 (0.00)", width=15)
-        self.overall_status_label.grid(row=row, column=1, sticky=tk.W, padx=(0, 5))
+        layout.append((self.overall_status_label, 'grid', dict(row=row, column=1, sticky=tk.W, padx=(0, 5))))
+        
+        self.overall_status_var = tk.DoubleVar(value=0.0)
+        self.overall_status_progress = ttk.Progressbar(self.expression_frame, length=250, mode='determinate',
+                                                       maximum=100, variable=self.overall_status_var)
+        layout.append((self.overall_status_progress, 'grid', dict(row=row, column=2, columnspan=4, sticky=(tk.W, tk.E), padx=(0, 15))))
         
-        self.overall_status_progress = ttk.Progressbar(self.expression_frame, length=250, mode='determinate')
-        self.overall_status_progress.grid(row=row, column=2, columnspan=4, sticky=(tk.W, tk.E), padx=(0, 15))
-        self.overall_status_progress['maximum'] = 100
+        # 一次性完成布局
+        self._apply_layout(layout)
+        
+        # 初始化摄像头列表（延迟到窗口绘制后再检测）
+        self.root.after(100, self.refresh_camera_list)
+    
+    def _apply_layout(self, layout):
+        """按顺序对组件执行几何布局，layout为(组件, 'pack'/'grid', 参数)列表"""
+        for widget, manager, options in layout:
+            getattr(widget, manager)(**options)
+    
+    def _now_ts(self):
+        """获取当前时间戳文本（同一秒内复用缓存结果）"""
+        now = int(time.time())
+        if now != self._ts_cache[0]:
+            self._ts_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._ts_cache[1]
     
     def log(self, message: str):
         """添加日志消息"""
-        timestamp = time.strftime("%H:%M:%S")
-        log_message = f"[{timestamp}] {message}\n"
+        timestamp = self._now_ts()
         
-        # 在主线程中更新UI
-        self.root.after(0, lambda: self._update_log(log_message))
+        # 放入UI队列，由主线程定时批量写入
+        self._log_queue.append(f"[{timestamp}] {message}\n")
+    
+    def _on_root_map(self, event):
+        """主窗口恢复显示"""
+        if event.widget is self.root:
+            self._ui_visible = True
+    
+    def _on_root_unmap(self, event):
+        """主窗口被最小化"""
+        if event.widget is self.root:
+            self._ui_visible = False
+    
+    def _drain_ui_queue(self):
+        """批量处理UI队列中的日志和语音输出（在主线程中调用）"""
+        try:
+            # 窗口最小化时只在队列中累积消息，恢复显示后再一次性写入
+            if not self._ui_visible:
+                return
+            
+            speech_queue = self._speech_queue
+            while speech_queue:
+                self._update_speech_output(*speech_queue.popleft())
+            
+            log_queue = self._log_queue
+            log_messages = []
+            while log_queue:
+                log_messages.append(log_queue.popleft())
+            
+            # 所有日志合并为一次插入
+            if log_messages:
+                self._update_log("".join(log_messages))
+        except Exception as e:
+            print(f"更新界面队列错误: {e}")
+        finally:
+            self.root.after(50, self._drain_ui_queue)
+    
+    def _post_to_ui(self, fn, *args):
+        """（任意线程）把回调投递到主线程执行，窗口关闭后直接丢弃"""
+        if self._closing.is_set():
+            return
+        try:
+            self.root.after(0, fn, *args)
+        except (RuntimeError, tk.TclError):
+            # 检查标志后窗口恰好被销毁
+            pass
+    
+    def _debounce(self, key, fn, delay_ms=100):
+        """（主线程）防抖：同一key在delay_ms内的多次调用只在最后一次之后执行一次fn"""
+        after_id = self._after_ids.pop(key, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._after_ids[key] = self.root.after(delay_ms, self._run_debounced, key, fn)
+    
+    def _run_debounced(self, key, fn):
+        """防抖定时器到期：执行合并后的刷新"""
+        self._after_ids.pop(key, None)
+        fn()
     
     def _update_log(self, message: str):
         """更新日志显示（在主线程中调用）"""
         self.log_text.insert(tk.END, message)
+        
+        # 限制日志行数，超出时一次删除最早的部分
+        line_count = int(self.log_text.index("end-1c").split('.')[0])
+        if line_count > 1000:
+            self.log_text.delete("1.0", f"{line_count - 800}.0")
+        
         self.log_text.see(tk.END)
     
     def clear_log(self):
@@ -1106,35 +1404,29 @@ class VRChatOSCGUI:
     
     def add_speech_output(self, text: str, source: str = None):
         """添加语音识别输出"""
-        timestamp = time.strftime("%H:%M:%S")
+        timestamp = self._now_ts()
         
-        # 在主线程中更新UI
-        self.root.after(0, lambda: self._update_speech_output(timestamp, source, text))
+        # 放入UI队列，由主线程定时批量写入
+        self._speech_queue.append((timestamp, source, text))
     
     def _update_speech_output(self, timestamp: str, source: str, text: str):
         """更新语音识别输出显示（在主线程中调用）"""
-        # 插入时间戳（灰色）
-        start_pos = self.speech_text.index(tk.END + "-1c")
-        self.speech_text.insert(tk.END, f"[{timestamp}] ")
-        self.speech_text.tag_add(self.get_text("timestamp"), start_pos, self.speech_text.index(tk.END + "-1c"))
-        
-        # 插入来源标签（彩色）
-        start_pos = self.speech_text.index(tk.END + "-1c")
-        self.speech_text.insert(tk.END, f"[{source}] ")
-        self.speech_text.tag_add(source, start_pos, self.speech_text.index(tk.END + "-1c"))
-        
-        # 插入语音内容（黑色）
-        self.speech_text.insert(tk.END, f"{text}\n")
+        # 一次插入：时间戳（灰色）、来源标签（彩色）、语音内容（黑色）
+        self.speech_text.insert(
+            tk.END,
+            f"[{timestamp}] ", (self.get_text("timestamp"),),
+            f"[{source}] ", (source,) if source else (),
+            f"{text}\n", ()
+        )
         
         # 滚动到底部
         self.speech_text.see(tk.END)
         
-        # 限制最大行数，防止内存占用过多
-        lines = self.speech_text.get(1.0, tk.END).split('\n')
-        if len(lines) > 500:  # 保留最近500条记录
+        # 限制最大行数，防止内存占用过多（直接从索引读取行数，无需复制整个缓冲区）
+        line_count = int(self.speech_text.index("end-1c").split('.')[0])
+        if line_count > 500:  # 保留最近500条记录
             # 删除前100行
-            for i in range(100):
-                self.speech_text.delete(1.0, "2.0")
+            self.speech_text.delete("1.0", "101.0")
     
     def clear_speech_output(self):
         """清空语音识别输出"""
@@ -1143,8 +1435,6 @@ class VRChatOSCGUI:
     def save_speech_output(self):
         """保存语音识别输出到文件"""
         try:
-            import tkinter.filedialog as filedialog
-            
             filename = filedialog.asksaveasfilename(
                 title=self.get_text("save_speech_record"),
                 defaultextension=".txt",
@@ -1167,13 +1457,13 @@ class VRChatOSCGUI:
         
         if connected:
             self.connect_btn.config(text=self.get_text("disconnect"))
-            self.status_label.config(text=self.get_text("connected"), foreground="green")
+            self.status_label.config(text=self.get_text("connected"), style="Status.Connected.TLabel")
             # 启用功能按钮
             self.listen_btn.config(state="normal")
             self.upload_voice_btn.config(state="normal")
         else:
             self.connect_btn.config(text=self.get_text("connect"))
-            self.status_label.config(text=self.get_text("disconnected"), foreground="red")
+            self.status_label.config(text=self.get_text("disconnected"), style="Status.Disconnected.TLabel")
             # 禁用功能按钮
             self.listen_btn.config(state="disabled")
             self.upload_voice_btn.config(state="disabled")
@@ -1185,6 +1475,10 @@ class VRChatOSCGUI:
     
     def toggle_connection(self):
         """切换连接状态"""
+        # 连接任务进行中时忽略重复点击
+        if self._connect_future is not None:
+            return
+        
         if not self.is_connected:
             self.connect_to_vrchat()
         else:
@@ -1206,45 +1500,41 @@ class VRChatOSCGUI:
             self.log(f"正在加载语音识别模型 ({device})...")
             self.log("提示：首次加载可能需要较长时间，请耐心等待...")
             
-            # 在后台线程中连接，避免界面卡顿
+            # 在后台线程池中连接，避免界面卡顿
             def connect_thread():
-                try:
-                    # 创建OSC客户端，传递参数（如果与配置不同）
-                    use_config_host = host == self.config.osc_host
-                    use_config_ports = (send_port == self.config.osc_send_port and 
-                                       receive_port == self.config.osc_receive_port)
-                    use_config_device = device == self.config.voice_device
-                    
-                    # 只传递与配置不同的参数
-                    self.client = VRChatController(
-                        host=None if use_config_host else host,
-                        send_port=None if use_config_ports else send_port,
-                        receive_port=None if use_config_ports else receive_port,
-                        speech_device=None if use_config_device else device
-                    )
-                    
-                    # 设置回调函数
-                    self.client.set_status_change_callback(self.on_status_change)
-                    self.client.set_voice_result_callback(self.on_voice_result)
-                    
-                    # 应用默认设置
-                    if hasattr(self.client, 'set_disable_fallback_mode'):
-                        self.client.set_disable_fallback_mode(self.disable_fallback_var.get())
-                    
-                    # 启动服务器
-                    success = self.client.start_osc_server()
-                    
-                    if success:
-                        # 在主线程中更新UI
-                        self.root.after(0, lambda: self._connection_success(host, send_port))
-                    else:
-                        self.root.after(0, lambda: self._connection_failed("OSC服务器启动失败"))
-                        
-                except Exception as e:
-                    self.root.after(0, lambda: self._connection_failed(str(e)))
+                # 创建OSC客户端，传递参数（如果与配置不同）
+                use_config_host = host == self.config.osc_host
+                use_config_ports = (send_port == self.config.osc_send_port and 
+                                   receive_port == self.config.osc_receive_port)
+                use_config_device = device == self.config.voice_device
+                
+                # 只传递与配置不同的参数
+                self.client = VRChatController(
+                    host=None if use_config_host else host,
+                    send_port=None if use_config_ports else send_port,
+                    receive_port=None if use_config_ports else receive_port,
+                    speech_device=None if use_config_device else device
+                )
+                
+                self._last_applied = {}
+                self._last_sent_expr = None
+                
+                # 设置回调函数
+                self.client.set_status_change_callback(self.on_status_change)
+                self.client.set_voice_result_callback(self.on_voice_result)
+                
+                # 应用默认设置
+                if hasattr(self.client, 'set_disable_fallback_mode'):
+                    self._apply_client_setting('set_disable_fallback_mode', self.disable_fallback_var.get())
+                
+                # 启动服务器
+                return self.client.start_osc_server()
             
-            # 启动连接线程
-            threading.Thread(target=connect_thread, daemon=True).start()
+            # 提交连接任务，完成后回到主线程更新UI
+            self._connect_future = self._io_pool.submit(connect_thread)
+            self._connect_future.add_done_callback(
+                lambda future: self._post_to_ui(self._on_connect_done, future, host, send_port)
+            )
             
         except ValueError:
             self.connect_btn.config(text="连接", state="normal")
@@ -1258,6 +1548,25 @@ class VRChatOSCGUI:
             messagebox.showerror(self.get_text("connection_error"), f"{self.get_text('cannot_connect_vrchat')}: {e}")
             self.log(f"连接失败: {e}")
     
+    def _on_connect_done(self, future, host: str, send_port: int):
+        """连接任务完成后的UI更新（在主线程中调用）"""
+        self._connect_future = None
+        
+        if future.cancelled():
+            self._connection_failed("连接已取消")
+            return
+        
+        try:
+            success = future.result()
+        except Exception as e:
+            self._connection_failed(str(e))
+            return
+        
+        if success:
+            self._connection_success(host, send_port)
+        else:
+            self._connection_failed("OSC服务器启动失败")
+    
     def _connection_success(self, host: str, send_port: int):
         """连接成功的UI更新"""
         # 隐藏进度条
@@ -1320,12 +1629,9 @@ class VRChatOSCGUI:
             # 即使出错也要更新UI状态
             self.update_ui_state(False)
     
+    @require_connected()
     def send_text_message(self):
         """发送文字消息"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            return
-        
         message = self.message_entry.get().strip()
         if not message:
             return
@@ -1338,12 +1644,9 @@ class VRChatOSCGUI:
             messagebox.showerror(self.get_text("send_error"), f"{self.get_text('send_message_failed')}: {e}")
             self.log(f"发送消息失败: {e}")
     
+    @require_connected()
     def toggle_voice_listening(self):
         """切换语音监听状态"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            return
-        
         if not self.is_listening:
             self.start_voice_listening()
         else:
@@ -1410,12 +1713,9 @@ class VRChatOSCGUI:
         except Exception as e:
             self.log(f"停止语音监听时出错: {e}")
     
+    @require_connected()
     def send_parameter(self):
         """发送Avatar参数"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            return
-        
         param_name = self.param_name_entry.get().strip()
         param_value_str = self.param_value_entry.get().strip()
         
@@ -1424,20 +1724,18 @@ class VRChatOSCGUI:
             return
         
         try:
-            # 尝试转换参数值类型
-            param_value = param_value_str
-            if param_value_str.lower() in ['true', 'false']:
-                param_value = param_value_str.lower() == 'true'
-            elif '.' in param_value_str:
-                try:
-                    param_value = float(param_value_str)
-                except ValueError:
-                    pass
-            else:
+            # 尝试转换参数值类型：布尔 -> 整数 -> 小数 -> 字符串
+            param_value = PARAM_BOOL_LITERALS.get(param_value_str.lower())
+            if param_value is None:
+                param_value = param_value_str
                 try:
                     param_value = int(param_value_str)
                 except ValueError:
-                    pass
+                    if '.' in param_value_str:
+                        try:
+                            param_value = float(param_value_str)
+                        except ValueError:
+                            pass
             
             self.client.send_parameter(param_name, param_value)
             self.log(f"[发送参数] {param_name} = {param_value}")
@@ -1470,7 +1768,7 @@ class VRChatOSCGUI:
         """更新语音阈值"""
         threshold = float(value)
         if self.client:
-            self.client.set_voice_threshold(threshold)
+            self._apply_client_setting('set_voice_threshold', threshold)
         self.threshold_label.config(text=f"{threshold:.3f}")
         self.log(f"语音阈值已设置为: {threshold:.3f}")
     
@@ -1478,7 +1776,7 @@ class VRChatOSCGUI:
         """更新断句间隔阈值"""
         threshold = float(value)
         if self.client and hasattr(self.client, 'set_sentence_pause_threshold'):
-            self.client.set_sentence_pause_threshold(threshold)
+            self._apply_client_setting('set_sentence_pause_threshold', threshold)
         # 同时更新配置
         self.config.set('Recording', 'sentence_pause_threshold', threshold)
         self.pause_label.config(text=f"{threshold:.1f}s")
@@ -1512,13 +1810,13 @@ class VRChatOSCGUI:
             # 如果有活动连接，应用新设置
             if self.is_connected and self.client:
                 # 应用语音设置
-                self.client.set_voice_threshold(self.config.voice_threshold)
-                self.client.set_sentence_pause_threshold(self.config.sentence_pause_threshold)
+                self._apply_client_setting('set_voice_threshold', self.config.voice_threshold)
+                self._apply_client_setting('set_sentence_pause_threshold', self.config.sentence_pause_threshold)
                 
                 # 应用模式设置
-                self.client.set_fallback_mode(self.config.use_fallback_mode)
-                self.client.set_disable_fallback_mode(self.config.disable_fallback_mode)
-                self.client.set_debug_mode(self.config.osc_debug_mode)
+                self._apply_client_setting('set_fallback_mode', self.config.use_fallback_mode)
+                self._apply_client_setting('set_disable_fallback_mode', self.config.disable_fallback_mode)
+                self._apply_client_setting('set_debug_mode', self.config.osc_debug_mode)
                 
             # 更新窗口大小（如果需要）
             current_geometry = self.root.geometry()
@@ -1532,11 +1830,18 @@ class VRChatOSCGUI:
         except Exception as e:
             self.log(f"[错误] 应用设置时出错: {e}")
     
+    def _apply_client_setting(self, setter_name, value):
+        """将设置应用到客户端，与上次应用的值相同时跳过"""
+        if self._last_applied.get(setter_name) == value:
+            return
+        getattr(self.client, setter_name)(value)
+        self._last_applied[setter_name] = value
+    
     def update_voice_threshold(self, value):
         """更新语音阈值"""
         threshold = float(value)
         if self.client:
-            self.client.set_voice_threshold(threshold)
+            self._apply_client_setting('set_voice_threshold', threshold)
         # 同时更新配置
         self.config.set('Voice', 'voice_threshold', threshold)
         self.threshold_label.config(text=f"{threshold:.3f}")
@@ -1545,13 +1850,9 @@ class VRChatOSCGUI:
     def open_settings_window(self):
         """打开高级设置窗口"""
         try:
-            from ui.settings_window import SettingsWindow
-            
             # 创建设置窗口，传入回调函数
             settings_window = SettingsWindow(self.root, self.on_settings_saved)
             
-        except ImportError as e:
-            messagebox.showerror("错误", f"无法加载设置窗口: {e}")
         except Exception as e:
             messagebox.showerror("错误", f"打开设置窗口失败: {e}")
     
@@ -1570,6 +1871,8 @@ class VRChatOSCGUI:
     
     def on_closing(self):
         """窗口关闭事件处理"""
+        # 先置位关闭标志，之后完成的后台任务不再向已销毁的窗口投递回调
+        self._closing.set()
         try:
             if self.camera_running:
                 self.stop_camera_only()
@@ -1582,18 +1885,28 @@ class VRChatOSCGUI:
             if self.single_ai_manager:
                 print("正在清理AI角色管理器...")
                 self.single_ai_manager.cleanup()
+            
+            # 关闭后台线程池，取消尚未开始的任务
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._detect_pool.shutdown(wait=False, cancel_futures=True)
+            self._asr_pool.shutdown(wait=False, cancel_futures=True)
+            
+            # 销毁窗口前释放画面数据占用的内存
+            if self.camera:
+                self.camera.release()
+                self.camera = None
+            self._video_photo = None
+            self._pending_image = None
+            self.current_frame = None
                 
             self.root.destroy()
         except Exception as e:
             print(f"关闭程序时出错: {e}")
             self.root.destroy()
     
+    @require_connected()
     def upload_voice_file(self):
         """上传语音文件"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            return
-        
         # 选择文件
         file_path = filedialog.askopenfilename(
             title=self.get_text("upload_voice"),
@@ -1609,129 +1922,126 @@ class VRChatOSCGUI:
         if not file_path:
             return
         
+        # 解码和识别都在后台线程中进行，避免大文件阻塞界面
+        self._asr_pool.submit(self._load_and_recognize_voice_file, file_path)
+    
+    def _load_and_recognize_voice_file(self, file_path):
+        """加载音频文件并识别发送（在后台线程中调用）"""
         try:
             self.log(f"加载音频文件: {os.path.basename(file_path)}")
             
-            # 读取音频文件
-            audio_data, sample_rate = sf.read(file_path)
-            
-            # 转换为单声道（如果是立体声）
-            if len(audio_data.shape) > 1:
-                audio_data = np.mean(audio_data, axis=1)
-            
-            # 转换为float32格式
-            audio_data = audio_data.astype(np.float32)
-            
-            # 保存上传的音频数据
-            self.uploaded_audio_data = audio_data
+            # 先读取文件信息，音频数据在识别前分块读入单声道缓冲区
+            info = sf.info(file_path)
+            sample_rate = info.samplerate
             self.uploaded_audio_sample_rate = sample_rate
             self.uploaded_filename = os.path.basename(file_path)
             
-            duration = len(audio_data) / sample_rate
+            duration = info.frames / sample_rate
             self.log(f"[成功] 音频文件加载成功: {self.uploaded_filename}")
             self.log(f"   时长: {duration:.2f}秒, 采样率: {sample_rate}Hz")
             
-            # 直接识别并发送音频文件
-            self.log(f"开始识别音频文件: {self.uploaded_filename}")
-            
-            def recognize_and_send():
-                try:
-                    # 识别音频文件
-                    text = self.client.speech_engine.recognize_audio(
-                        audio_data, sample_rate, self.language_var.get()
-                    )
-                    
-                    if text and text.strip():
-                        # 显示在语音识别输出框
-                        self.add_speech_output(text, f"文件: {self.uploaded_filename}")
-                        # 发送到VRChat
-                        self.client.send_text_message(f"[音频文件] {text}")
-                        # 记录到日志
-                        self.log(f"[成功] 音频文件识别并发送: {text}")
-                        
-                        # 如果启用了LLM处理，发送到LLM
-                        if self.llm_enabled and self.llm_handler and self.llm_handler.is_client_ready():
-                            request_id = self.llm_handler.submit_voice_text(text)
-                            if request_id:
-                                self.log(f"[LLM] 已提交音频文件到AI处理: {text[:50]}...")
-                            else:
-                                self.log("[LLM] 提交音频文件到AI失败")
-                    else:
-                        self.log("[错误] 音频文件识别失败")
-                        
-                except Exception as e:
-                    self.log(f"[错误] 音频文件识别出错: {e}")
-                    messagebox.showerror("识别错误", f"音频识别失败: {e}")
+        except Exception as e:
+            self.log(f"[错误] 音频文件加载失败: {e}")
+            self._post_to_ui(messagebox.showerror, "文件错误", f"无法加载音频文件: {e}")
+            return
+        
+        # 直接识别并发送音频文件
+        self.log(f"开始识别音频文件: {self.uploaded_filename}")
+        
+        try:
+            language = self.language_var.get()
+            
+            # 分块读取并直接混合到预分配的单声道缓冲区，不保留多声道的完整副本；
+            # 整个文件一次交给Whisper识别，由其按时间戳滑动窗口并沿用上文，避免在块边界切断词语
+            audio = np.empty(info.frames, dtype=np.float32)
+            offset = 0
+            for block in sf.blocks(file_path, blocksize=sample_rate * 30, dtype='float32', always_2d=True):
+                # 窗口关闭后放弃读取，尽快结束识别线程
+                if self._closing.is_set():
+                    return
+                end = offset + len(block)
+                if block.shape[1] == 1:
+                    audio[offset:end] = block[:, 0]
+                else:
+                    np.mean(block, axis=1, dtype=np.float32, out=audio[offset:end])
+                offset = end
+            audio = audio[:offset]
             
-            # 在后台线程中进行识别
-            threading.Thread(target=recognize_and_send, daemon=True).start()
+            text = self.client.speech_engine.recognize_audio(audio, sample_rate, language)
+            text = text.strip() if text else ""
+            if self._closing.is_set():
+                return
             
+            if text:
+                # 显示在语音识别输出框
+                self.add_speech_output(text, f"文件: {self.uploaded_filename}")
+                # 发送到VRChat
+                self.client.send_text_message(f"[音频文件] {text}")
+                # 记录到日志
+                self.log(f"[成功] 音频文件识别并发送: {text}")
+                
+                # 如果启用了LLM处理，发送到LLM
+                if self.llm_enabled and self.llm_handler and self.llm_handler.is_client_ready():
+                    request_id = self.llm_handler.submit_voice_text(text)
+                    if request_id:
+                        self.log(f"[LLM] 已提交音频文件到AI处理: {text[:50]}...")
+                    else:
+                        self.log("[LLM] 提交音频文件到AI失败")
+            else:
+                self.log("[错误] 音频文件识别失败")
+                
         except Exception as e:
-            self.log(f"[错误] 音频文件加载失败: {e}")
-            messagebox.showerror("文件错误", f"无法加载音频文件: {e}")
+            self.log(f"[错误] 音频文件识别出错: {e}")
+            self._post_to_ui(messagebox.showerror, "识别错误", f"音频识别失败: {e}")
     
+    @require_connected('debug_var')
     def toggle_debug_mode(self):
         """切换调试模式"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            self.debug_var.set(False)
-            return
-        
         debug_enabled = self.debug_var.get()
-        self.client.set_debug_mode(debug_enabled)
+        self._apply_client_setting('set_debug_mode', debug_enabled)
         status = "启用" if debug_enabled else "禁用"
         self.log(f"OSC调试模式已{status}")
     
+    @require_connected('fallback_var')
     def toggle_fallback_mode(self):
         """切换强制备用模式"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            self.fallback_var.set(False)
-            return
-        
         # 如果启用强制备用模式，自动禁用"禁用备用模式"
         if self.fallback_var.get():
             self.disable_fallback_var.set(False)
             if hasattr(self.client, 'set_disable_fallback_mode'):
-                self.client.set_disable_fallback_mode(False)
+                self._apply_client_setting('set_disable_fallback_mode', False)
         
         fallback_enabled = self.fallback_var.get()
-        self.client.set_fallback_mode(fallback_enabled)
+        self._apply_client_setting('set_fallback_mode', fallback_enabled)
         status = "启用" if fallback_enabled else "禁用"
         self.log(f"强制备用模式已{status}")
     
+    @require_connected('disable_fallback_var')
     def toggle_disable_fallback_mode(self):
         """切换禁用备用模式"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            self.disable_fallback_var.set(False)
-            return
-        
         # 如果禁用备用模式，自动禁用"强制备用模式"
         if self.disable_fallback_var.get():
             self.fallback_var.set(False)
-            self.client.set_fallback_mode(False)
+            self._apply_client_setting('set_fallback_mode', False)
         
         disable_enabled = self.disable_fallback_var.get()
         if hasattr(self.client, 'set_disable_fallback_mode'):
-            self.client.set_disable_fallback_mode(disable_enabled)
+            self._apply_client_setting('set_disable_fallback_mode', disable_enabled)
             status = "禁用" if disable_enabled else "启用"
             self.log(f"备用模式已{status}")
             
             if disable_enabled:
                 self.log("注意：系统将只依赖VRChat语音状态，请确保VRChat OSC功能正常")
     
+    @require_connected()
     def show_debug_status(self):
         """显示调试状态信息"""
-        if not self.is_connected:
-            messagebox.showwarning(self.get_text("warning"), self.get_text("please_connect_first"))
-            return
-        
         try:
             # 获取详细状态信息
-            status = self.client.get_status()
-            debug_info = self.client.get_debug_info()
-            diagnosis = self.client.osc_client.get_vrchat_connection_diagnosis()
+            snapshot = self.client.get_full_status_snapshot()
+            status = snapshot['status']
+            debug_info = snapshot['debug']
+            diagnosis = snapshot['diagnosis']
             
             # 创建状态信息窗口
             status_window = tk.Toplevel(self.root)
@@ -1744,68 +2054,68 @@ class VRChatOSCGUI:
             status_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
             # 格式化状态信息
-            status_info = "=== VRChat OSC 系统状态 ===\n\n"
+            parts = ["=== VRChat OSC 系统状态 ===\n\n"]
             
             # 基本状态
-            status_info += "【连接状态】\n"
-            status_info += f"OSC服务器: {'运行中' if status['osc_connected'] else '未运行'}\n"
-            status_info += f"VRChat语音状态: {'说话中' if status['vrc_speaking'] else '静音'}\n"
-            status_info += f"VRChat语音强度: {status['vrc_voice_level']:.4f}\n"
-            status_info += f"语音监听: {'运行中' if status['voice_listening'] else '未运行'}\n"
-            status_info += f"语音引擎: {'就绪' if status['speech_engine_ready'] else '未就绪'}\n\n"
+            parts.append("【连接状态】\n")
+            parts.append(f"OSC服务器: {'运行中' if status['osc_connected'] else '未运行'}\n")
+            parts.append(f"VRChat语音状态: {'说话中' if status['vrc_speaking'] else '静音'}\n")
+            parts.append(f"VRChat语音强度: {status['vrc_voice_level']:.4f}\n")
+            parts.append(f"语音监听: {'运行中' if status['voice_listening'] else '未运行'}\n")
+            parts.append(f"语音引擎: {'就绪' if status['speech_engine_ready'] else '未就绪'}\n\n")
             
             # 模式状态
-            status_info += "【录制模式】\n"
-            status_info += f"备用模式激活: {'是' if status['fallback_mode_active'] else '否'}\n"
-            status_info += f"强制备用模式: {'是' if status['use_fallback_mode'] else '否'}\n\n"
+            parts.append("【录制模式】\n")
+            parts.append(f"备用模式激活: {'是' if status['fallback_mode_active'] else '否'}\n")
+            parts.append(f"强制备用模式: {'是' if status['use_fallback_mode'] else '否'}\n\n")
             
             # VRChat参数
-            status_info += "【检测到的VRChat语音参数】\n"
+            parts.append("【检测到的VRChat语音参数】\n")
             if status['received_voice_parameters']:
                 for param in status['received_voice_parameters']:
-                    status_info += f"- {param}\n"
+                    parts.append(f"- {param}\n")
             else:
-                status_info += "未检测到任何VRChat语音参数\n"
-            status_info += "\n"
+                parts.append("未检测到任何VRChat语音参数\n")
+            parts.append("\n")
             
             # 监听的参数列表
-            status_info += "【监听的参数列表】\n"
+            parts.append("【监听的参数列表】\n")
             for param in debug_info['osc']['monitoring_parameters']:
-                status_info += f"- {param}\n"
-            status_info += "\n"
+                parts.append(f"- {param}\n")
+            parts.append("\n")
             
             # 语音引擎信息
-            status_info += "【语音引擎】\n"
-            status_info += f"计算设备: {debug_info['speech_engine']['device']}\n"
-            status_info += f"语音阈值: {debug_info['speech_engine']['voice_threshold']}\n"
-            status_info += f"模型已加载: {'是' if debug_info['speech_engine']['model_loaded'] else '否'}\n\n"
+            parts.append("【语音引擎】\n")
+            parts.append(f"计算设备: {debug_info['speech_engine']['device']}\n")
+            parts.append(f"语音阈值: {debug_info['speech_engine']['voice_threshold']}\n")
+            parts.append(f"模型已加载: {'是' if debug_info['speech_engine']['model_loaded'] else '否'}\n\n")
             
             # 调试信息
-            status_info += "【调试设置】\n"
-            status_info += f"OSC调试模式: {'启用' if debug_info['osc']['debug_mode'] else '禁用'}\n"
-            status_info += f"VRChat检测超时: {debug_info['controller']['vrc_detection_timeout']}秒\n\n"
+            parts.append("【调试设置】\n")
+            parts.append(f"OSC调试模式: {'启用' if debug_info['osc']['debug_mode'] else '禁用'}\n")
+            parts.append(f"VRChat检测超时: {debug_info['controller']['vrc_detection_timeout']}秒\n\n")
             
             # VRChat连接诊断
-            status_info += "【VRChat连接诊断】\n"
+            parts.append("【VRChat连接诊断】\n")
             if diagnosis['status'] == 'working':
-                status_info += "[成功] VRChat OSC连接正常\n"
+                parts.append("[成功] VRChat OSC连接正常\n")
             elif diagnosis['status'] == 'no_vrchat_data':
-                status_info += "[错误] 未检测到VRChat数据\n"
-                status_info += "\n[搜索] 可能原因:\n"
+                parts.append("[错误] 未检测到VRChat数据\n")
+                parts.append("\n[搜索] 可能原因:\n")
                 for issue in diagnosis['issues']:
-                    status_info += f"• {issue}\n"
-                status_info += "\n[建议] 建议解决方案:\n"
+                    parts.append(f"• {issue}\n")
+                parts.append("\n[建议] 建议解决方案:\n")
                 for suggestion in diagnosis['suggestions']:
-                    status_info += f"• {suggestion}\n"
+                    parts.append(f"• {suggestion}\n")
             elif diagnosis['status'] == 'receiving_data_but_no_voice':
-                status_info += "[警告] 收到VRChat数据但无语音状态\n"
-                status_info += "\n[建议] 建议:\n"
+                parts.append("[警告] 收到VRChat数据但无语音状态\n")
+                parts.append("\n[建议] 建议:\n")
                 for suggestion in diagnosis['suggestions']:
-                    status_info += f"• {suggestion}\n"
+                    parts.append(f"• {suggestion}\n")
             else:
-                status_info += "❓ 连接状态未知\n"
+                parts.append("❓ 连接状态未知\n")
             
-            status_text.insert(tk.END, status_info)
+            status_text.insert(tk.END, "".join(parts))
             status_text.config(state=tk.DISABLED)
             
         except Exception as e:
@@ -1817,128 +2127,36 @@ class VRChatOSCGUI:
         selected_display = self.ui_language_display.get()
         selected_lang = DISPLAY_TO_LANGUAGE_MAP.get(selected_display, "zh")
         
-        # 更新内部语言变量
+        # 更新内部语言变量，并清空旧语言的文本缓存
         self.ui_language.set(selected_lang)
+        self._text_cache.clear()
         
         # 更新窗口标题
         self.root.title(self.get_text("title"))
         
-        # 更新所有界面框架标题
-        self.connection_frame.config(text=self.get_text("connection_settings"))
-        self.message_frame.config(text=self.get_text("message_send"))
-        self.param_frame.config(text=self.get_text("avatar_params"))
-        self.log_frame.config(text=self.get_text("log"))
-        self.speech_frame.config(text=self.get_text("speech_output"))
-        
-        # 更新摄像头区域文本
-        if hasattr(self, 'camera_control_frame'):
-            self.camera_control_frame.config(text=self.get_text("camera_control"))
-            self.camera_display_frame.config(text=self.get_text("camera_feed"))
-            self.expression_frame.config(text=self.get_text("realtime_expression"))
-        
-        # 更新所有标签文本
-        if hasattr(self, 'text_message_label'):
-            self.text_message_label.config(text=self.get_text("text_message"))
-        if hasattr(self, 'recognition_language_label'):
-            self.recognition_language_label.config(text=self.get_text("recognition_language"))
-        if hasattr(self, 'compute_device_label'):
-            self.compute_device_label.config(text=self.get_text("compute_device"))
-        if hasattr(self, 'voice_threshold_label'):
-            self.voice_threshold_label.config(text=self.get_text("voice_threshold"))
-        if hasattr(self, 'param_name_label'):
-            self.param_name_label.config(text=self.get_text("param_name"))
-        if hasattr(self, 'param_value_label'):
-            self.param_value_label.config(text=self.get_text("param_value"))
-        
-        # 更新摄像头控制标签
-        if hasattr(self, 'camera_label'):
-            self.camera_label.config(text=self.get_text("camera"))
-            self.model_label.config(text=self.get_text("model"))
-        
-        # 更新所有按钮文本
-        if self.is_connected:
-            self.connect_btn.config(text=self.get_text("disconnect"))
-        else:
-            self.connect_btn.config(text=self.get_text("connect"))
-            
-        if self.is_listening:
-            self.listen_btn.config(text=self.get_text("stop_listening"))
-        else:
-            self.listen_btn.config(text=self.get_text("start_listening"))
-            
-        # 更新新添加的按钮和标签
-        if hasattr(self, 'advanced_settings_btn'):
-            self.advanced_settings_btn.config(text=self.get_text("advanced_settings"))
-        if hasattr(self, 'fallback_check'):
-            self.fallback_check.config(text=self.get_text("force_fallback_mode"))
-        if hasattr(self, 'disable_fallback_check'):
-            self.disable_fallback_check.config(text=self.get_text("disable_fallback_mode"))
-        if hasattr(self, 'save_expression_btn'):
-            self.save_expression_btn.config(text=self.get_text("save_expression"))
+        # 按对照表更新所有固定文本的框架、标签和按钮
+        for attr, key in self._LANG_BINDINGS:
+            widget = getattr(self, attr, None)
+            if widget is not None:
+                widget.config(text=self.get_text(key))
+        
         if hasattr(self, 'voicevox_control_frame'):
             self.voicevox_control_frame.config(text="VOICEVOX")
-        if hasattr(self, 'voicevox_test_btn'):
-            self.voicevox_test_btn.config(text=self.get_text("voice_test"))
         
-        # 更新状态标签
+        # 更新随状态变化的按钮和标签
+        self.connect_btn.config(text=self.get_text("disconnect" if self.is_connected else "connect"))
+        self.listen_btn.config(text=self.get_text("stop_listening" if self.is_listening else "start_listening"))
         if hasattr(self, 'status_label'):
-            if self.is_connected:
-                self.status_label.config(text=self.get_text("connected"))
-            else:
-                self.status_label.config(text=self.get_text("disconnected"))
-        if hasattr(self, 'voicevox_status_label') and hasattr(self, 'voicevox_status_label'):
-            # VOICEVOX状态根据实际连接状态更新
-            pass
-        
-        if hasattr(self, 'send_text_btn'):
-            self.send_text_btn.config(text=self.get_text("send_text"))
-        if hasattr(self, 'upload_voice_btn'):
-            self.upload_voice_btn.config(text=self.get_text("upload_voice"))
-        if hasattr(self, 'record_voice_btn'):
-            self.record_voice_btn.config(text=self.get_text("record_voice"))
-        if hasattr(self, 'debug_check'):
-            self.debug_check.config(text=self.get_text("debug"))
-        if hasattr(self, 'status_btn'):
-            self.status_btn.config(text=self.get_text("show_status"))
-        if hasattr(self, 'camera_btn'):
-            self.camera_btn.config(text=self.get_text("camera_window"))
-        if hasattr(self, 'settings_btn'):
-            self.settings_btn.config(text=self.get_text("settings"))
-        if hasattr(self, 'send_param_btn'):
-            self.send_param_btn.config(text=self.get_text("send_param"))
-        # 更新角色管理区域组件
-        if hasattr(self, 'add_character_btn'):
-            self.add_character_btn.config(text=self.get_text("add_character"))
-        if hasattr(self, 'remove_character_btn'):
-            self.remove_character_btn.config(text=self.get_text("remove_character"))
-        if hasattr(self, 'use_current_pos_btn'):
-            self.use_current_pos_btn.config(text=self.get_text("update_position"))
-        if hasattr(self, 'clear_log_btn'):
-            self.clear_log_btn.config(text=self.get_text("clear_log"))
-        if hasattr(self, 'clear_speech_btn'):
-            self.clear_speech_btn.config(text=self.get_text("clear_speech"))
-        if hasattr(self, 'save_speech_btn'):
-            self.save_speech_btn.config(text=self.get_text("save_speech"))
-        
-        # 更新摄像头控制按钮
-        if hasattr(self, 'refresh_btn'):
-            self.refresh_btn.config(text=self.get_text("refresh"))
+            self.status_label.config(text=self.get_text("connected" if self.is_connected else "disconnected"))
         if hasattr(self, 'camera_start_btn'):
-            if self.camera_running:
-                self.camera_start_btn.config(text=self.get_text("stop_camera"))
-            else:
-                self.camera_start_btn.config(text=self.get_text("start_camera"))
+            self.camera_start_btn.config(text=self.get_text("stop_camera" if self.camera_running else "start_camera"))
         if hasattr(self, 'face_detection_btn'):
-            if self.face_detection_running:
-                self.face_detection_btn.config(text=self.get_text("stop_face_detection"))
-            else:
-                self.face_detection_btn.config(text=self.get_text("start_face_detection"))
-        if hasattr(self, 'capture_btn'):
-            self.capture_btn.config(text=self.get_text("screenshot"))
+            self.face_detection_btn.config(
+                text=self.get_text("stop_face_detection" if self.face_detection_running else "start_face_detection"))
         
         # 更新摄像头显示区域文本
-        if hasattr(self, 'video_label') and not self.camera_running:
-            self.video_label.config(text=self.get_text("click_to_start"))
+        if hasattr(self, 'video_canvas') and not self.camera_running:
+            self.video_canvas.itemconfig(self._video_text_item, text=self.get_text("click_to_start"))
         
         # 重新构建表情数据标签（因为标签名称需要更新）
         if hasattr(self, 'expression_labels'):
@@ -1948,67 +2166,10 @@ class VRChatOSCGUI:
         self.log(f"界面语言已切换为: {selected_display}")
     
     def refresh_expression_labels(self):
-        """刷新表情数据标签的文本"""
-        # 销毁现有的表情显示组件
-        for widget in self.expression_frame.winfo_children():
-            widget.destroy()
-        
-        # 重新创建表情显示组件
-        row = 0
-        col = 0
-        self.expression_labels = {}
-        self.expression_progress_bars = {}
-        
-        for expr_name in self.expressions.keys():
-            # 表情名称
-            display_name = {
-                'angry': '愤怒',
-                'disgust': '厌恶',
-                'fear': '恐惧', 
-                'happy': '高兴',
-                'sad': '伤心',
-                'surprise': '惊讶',
-                'neutral': '中立'
-            }.get(expr_name, expr_name)
-            
-            # 使用正确的列偏移避免重叠：每列占用3个位置
-            base_col = col * 3
-            
-            ttk.Label(self.expression_frame, text=f"{display_name}:").grid(
-                row=row, column=base_col, sticky=tk.W, padx=(0, 5))
-            
-            # 数值显示
-            value_label = ttk.Label(self.expression_frame, text="0.00", width=6)
-            value_label.grid(row=row, column=base_col+1, sticky=tk.W, padx=(0, 5))
-            self.expression_labels[expr_name] = value_label
-            
-            # 进度条
-            progress = ttk.Progressbar(self.expression_frame, length=120, mode='determinate')
-            progress.grid(row=row, column=base_col+2, sticky=(tk.W, tk.E), padx=(0, 15))
-            progress['maximum'] = 100
-            self.expression_progress_bars[expr_name] = progress
-            
-            col += 1
-            if col >= 2:
-                col = 0
-                row += 1
-        
-        # 添加分隔线和整体状态显示
-        row += 1
-        separator = ttk.Separator(self.expression_frame, orient='horizontal')
-        separator.grid(row=row, column=0, columnspan=6, sticky=(tk.W, tk.E), pady=(10, 5))
-        
-        row += 1
-        # 整体情感状态显示
-        ttk.Label(self.expression_frame, text="整体状态:").grid(
-            row=row, column=0, sticky=tk.W, padx=(0, 5))
-        
-        self.overall_status_label = ttk.Label(self.expression_frame, text="中立 (0.00)", width=15)
-        self.overall_status_label.grid(row=row, column=1, sticky=tk.W, padx=(0, 5))
-        
-        self.overall_status_progress = ttk.Progressbar(self.expression_frame, length=250, mode='determinate')
-        self.overall_status_progress.grid(row=row, column=2, columnspan=4, sticky=(tk.W, tk.E), padx=(0, 15))
-        self.overall_status_progress['maximum'] = 100
+        """刷新表情数据标签的文本（只更新已有标签，不重建组件）"""
+        for expr_name, name_label in self.expression_name_labels.items():
+            name_label.config(text=f"{EXPR_DISPLAY_NAMES[expr_name]}:")
+        self.overall_name_label.config(text="整体状态:")
     
     def toggle_camera_only(self):
         """只切换摄像头状态（不包含面部识别）"""
@@ -2048,14 +2209,20 @@ class VRChatOSCGUI:
             if not self.camera.isOpened():
                 raise RuntimeError(f"无法打开摄像头 {camera_id}")
             
+            # 在首次读取前一次性完成配置：分辨率和只缓存最新一帧
+            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
             # 测试读取
             ret, frame = self.camera.read()
             if not ret or frame is None:
                 raise RuntimeError(f"摄像头 {camera_id} 无法读取画面")
             
-            # 设置分辨率
-            self.camera.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-            self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+            # 提示实际生效的分辨率（是否缩放由采集循环按每帧尺寸判断）
+            actual_height, actual_width = frame.shape[:2]
+            if (actual_width, actual_height) != (640, 480):
+                self.log(f"摄像头实际分辨率: {actual_width}x{actual_height}，将缩放显示")
             
             self.camera_running = True
             self.camera_start_btn.config(text="停止摄像头")
@@ -2063,9 +2230,11 @@ class VRChatOSCGUI:
             self.capture_btn.config(state="normal")
             self.save_expression_btn.config(state="normal")
             
-            # 启动简单的视频显示线程
+            # 启动采集线程，画面由主线程定时取最新帧显示
             self.camera_thread = threading.Thread(target=self.simple_video_loop, daemon=True)
             self.camera_thread.start()
+            if self._video_pump_id is None:
+                self._video_pump_id = self.root.after(30, self._pump_video)
             
             self.log(self.get_text("camera_start_success"))
             
@@ -2076,36 +2245,90 @@ class VRChatOSCGUI:
                 self.camera = None
     
     def simple_video_loop(self):
-        """简单的视频显示循环（不包含面部识别）"""
+        """摄像头采集循环（在后台线程中运行，read()本身按摄像头帧率阻塞）"""
+        # 预分配缩放和颜色转换的缓冲区，每帧复用
+        resize_buf = np.empty((480, 640, 3), dtype=np.uint8)
+        rgb_buf = np.empty_like(resize_buf)
+        
         while self.camera_running and self.camera and self.camera.isOpened():
             try:
                 ret, frame = self.camera.read()
-                if ret and frame is not None:
-                    # 调整图像大小
-                    display_frame = cv2.resize(frame, (640, 480))
-                    
-                    # 如果启用了面部识别，进行处理
-                    if self.face_detection_running:
-                        display_frame, expressions = self.process_face_detection(display_frame)
-                        # 更新表情显示
-                        self.root.after(0, lambda: self._update_expression_display(expressions))
-                    
-                    # 转换为显示格式
-                    frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
-                    img = Image.fromarray(frame_rgb)
-                    photo = ImageTk.PhotoImage(img)
-                    
-                    # 更新显示
-                    self.current_frame = frame
-                    self.root.after(0, lambda p=photo: self.update_video_display(p))
-                    
-                time.sleep(0.03)  # 约33fps
+                if not ret or frame is None:
+                    time.sleep(0.03)
+                    continue
+                
+                self.current_frame = frame
+                
+                # 调整图像大小（摄像头已按640x480输出时直接使用原帧）
+                if frame.shape[:2] == (480, 640):
+                    display_frame = frame
+                else:
+                    display_frame = cv2.resize(frame, (640, 480), dst=resize_buf)
+                
+                # 如果启用了面部识别，识别线程空闲时才提交新帧，画面由识别结果更新
+                if self.face_detection_running:
+                    future = self._detect_future
+                    if future is None or future.done():
+                        self._detect_future = self._detect_pool.submit(self._detect_frame, display_frame.copy())
+                    continue
+                
+                # 窗口最小化时跳过画面转换
+                if self._ui_visible:
+                    frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+                    self._pending_image = Image.fromarray(frame_rgb)  # 会复制像素，缓冲区可立即复用
                 
             except Exception as e:
                 if self.camera_running:
                     self.log(f"视频循环错误: {e}")
                 time.sleep(0.1)
     
+    def _detect_frame(self, frame):
+        """对一帧进行面部识别（在识别线程中调用）"""
+        # 窗口关闭后不再开始新的识别，避免退出时等待GPU推理
+        if self._closing.is_set():
+            return
+        try:
+            self._detect_frame_idx += 1
+            last = self._last_detection
+            if last is not None and self._detect_frame_idx % self._detect_every_n:
+                # 跳过识别：把上次识别绘制的标注直接叠加到当前帧上
+                mask, overlay = last
+                np.copyto(frame, overlay, where=mask)
+                display_frame = frame
+            else:
+                original = frame.copy()
+                display_frame, expressions = self.process_face_detection(frame)
+                # 记录识别器在画面上绘制的像素，供后续跳过的帧复用
+                if display_frame.shape == original.shape:
+                    self._last_detection = (display_frame != original, display_frame)
+                else:
+                    self._last_detection = None
+                # 只保留最新表情数据，由主线程的画面刷新统一调度显示
+                self._pending_expr = expressions
+            
+            if self._ui_visible and not self._closing.is_set():
+                frame_rgb = cv2.cvtColor(display_frame, cv2.COLOR_BGR2RGB)
+                self._pending_image = Image.fromarray(frame_rgb)
+        except Exception as e:
+            if self.camera_running and not self._closing.is_set():
+                self.log(f"面部识别线程错误: {e}")
+    
+    def _pump_video(self):
+        """定时显示最新画面（在主线程中调用）"""
+        self._video_pump_id = None
+        if not self.camera_running:
+            return
+        
+        img = self._pending_image
+        if img is not None:
+            self._pending_image = None
+            self.update_video_display(img)
+        
+        if self._pending_expr is not None:
+            self._schedule_expr_flush()
+        
+        self._video_pump_id = self.root.after(30, self._pump_video)
+    
     def start_face_detection(self):
         """启动面部识别"""
         try:
@@ -2124,6 +2347,7 @@ class VRChatOSCGUI:
                         self.emotion_model_type = 'Simple'
             
             # 这里不需要重新创建摄像头实例，只是设置标志
+            self._last_detection = None
             self.face_detection_running = True
             self.face_detection_btn.config(text="停止面部识别")
             
@@ -2132,24 +2356,91 @@ class VRChatOSCGUI:
         except Exception as e:
             self.log(f"面部识别启动失败: {e}")
     
+    def _get_face_cascade(self):
+        """获取Haar面部检测器（只加载一次）"""
+        if self._face_cascade is None:
+            self._face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
+            # 有可用的OpenCL设备且OpenCV已启用OpenCL（默认启用）时，通过UMat让颜色转换和检测走GPU/核显
+            self._use_opencl = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+        return self._face_cascade
+    
+    def _get_yunet(self):
+        """获取YuNet面部检测器（模型文件存在时只加载一次，否则返回None使用Haar）"""
+        if self._yunet is None:
+            self._yunet = False
+            if os.path.exists(YUNET_MODEL_PATH) and hasattr(cv2, 'FaceDetectorYN'):
+                try:
+                    self._yunet = cv2.FaceDetectorYN.create(YUNET_MODEL_PATH, "", (320, 240), YUNET_SCORE_THRESHOLD)
+                    self.log("面部检测使用YuNet模型")
+                except cv2.error as e:
+                    self.log(f"加载YuNet模型失败，使用Haar检测: {e}")
+        return self._yunet or None
+    
+    def _detect_faces_opencl(self, frame, small_size, min_size):
+        """通过OpenCL（UMat）在缩小后的灰度图上检测面部"""
+        gray = cv2.cvtColor(cv2.UMat(frame), cv2.COLOR_BGR2GRAY)
+        if small_size is not None:
+            gray = cv2.resize(gray, small_size, interpolation=cv2.INTER_AREA)
+        return self._face_cascade.detectMultiScale(gray, 1.1, 4, minSize=(min_size, min_size))
+    
+    def _detect_faces(self, frame, detect_width=320):
+        """在缩小后的灰度图上检测面部，返回原图坐标下的 (x, y, w, h) 列表"""
+        height, width = frame.shape[:2]
+        scale = min(1.0, detect_width / width)
+        small_size = (max(1, int(width * scale)), max(1, int(height * scale))) if scale < 1.0 else None
+        # 最小面部尺寸同样按比例缩小，保持与原图上100像素一致（两种检测器共用）
+        min_size = max(1, int(100 * scale))
+        
+        # 优先使用YuNet小型CNN检测器，在缩小后的彩色图上运行
+        yunet = self._get_yunet()
+        if yunet is not None:
+            small = frame
+            if small_size is not None:
+                if self._small_bgr_buf is None or self._small_bgr_buf.shape[1::-1] != small_size:
+                    self._small_bgr_buf = np.empty((small_size[1], small_size[0], 3), dtype=np.uint8)
+                small = cv2.resize(frame, small_size, dst=self._small_bgr_buf, interpolation=cv2.INTER_AREA)
+            yunet.setInputSize((small.shape[1], small.shape[0]))
+            _, faces = yunet.detect(small)
+            if faces is None:
+                return []
+            return [tuple(max(0, int(v / scale)) for v in face[:4]) for face in faces
+                    if face[2] >= min_size and face[3] >= min_size]
+        
+        cascade = self._get_face_cascade()
+        
+        faces = None
+        if self._use_opencl:
+            try:
+                faces = self._detect_faces_opencl(frame, small_size, min_size)
+            except cv2.error as e:
+                # OpenCL运行失败时之后都改用CPU路径
+                self._use_opencl = False
+                self.log(f"OpenCL面部检测失败，改用CPU: {e}")
+        
+        if faces is None:
+            # 灰度图和缩小图的缓冲区按画面尺寸分配一次，之后每帧复用
+            if self._gray_buf is None or self._gray_buf.shape != (height, width):
+                self._gray_buf = np.empty((height, width), dtype=np.uint8)
+                self._small_gray_buf = None
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray_buf)
+            
+            if small_size is not None:
+                if self._small_gray_buf is None:
+                    self._small_gray_buf = np.empty((small_size[1], small_size[0]), dtype=np.uint8)
+                gray = cv2.resize(gray, small_size, dst=self._small_gray_buf, interpolation=cv2.INTER_AREA)
+            
+            faces = cascade.detectMultiScale(gray, 1.1, 4, minSize=(min_size, min_size))
+        
+        return [tuple(int(v / scale) for v in face) for face in faces]
+    
     def process_face_detection(self, frame):
         """处理面部识别"""
-        expressions = {
-            'angry': 0.0,      # 愤怒
-            'disgust': 0.0,    # 厌恶
-            'fear': 0.0,       # 恐惧
-            'happy': 0.0,      # 高兴
-            'sad': 0.0,        # 伤心
-            'surprise': 0.0,   # 惊讶
-            'neutral': 0.0     # 中立
-        }
+        expressions = dict.fromkeys(EXPR_KEYS, 0.0)
         
         try:
             if self.emotion_model_type == 'Simple':
                 # 使用简单的OpenCV检测
-                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-                faces = face_cascade.detectMultiScale(gray, 1.1, 4, minSize=(100, 100))
+                faces = self._detect_faces(frame)
                 
                 # 绘制面部框
                 for (x, y, w, h) in faces:
@@ -2169,9 +2460,7 @@ class VRChatOSCGUI:
                         annotated_frame, expressions = self.gpu_detector.process_frame(frame)
                         return annotated_frame, expressions
                     except Exception as gpu_e:
-                        import traceback
-                        self.log(f"GPU情感识别处理错误 ({self.emotion_model_type}): {gpu_e}")
-                        self.log(f"详细错误信息: {traceback.format_exc()}")
+                        self._log_face_error(f"GPU情感识别处理错误 ({self.emotion_model_type}): {gpu_e}")
                         # 回退到简单模式
                         return self.process_simple_detection(frame)
                 else:
@@ -2183,33 +2472,34 @@ class VRChatOSCGUI:
                         annotated_frame, expressions = self.gpu_detector.process_frame(frame)
                         return annotated_frame, expressions
                     except Exception as init_e:
-                        import traceback
-                        self.log(f"GPU情感检测器初始化失败 ({self.emotion_model_type}): {init_e}")
-                        self.log(f"详细错误信息: {traceback.format_exc()}")
-                        self.log("回退到简单模式")
+                        self._log_face_error(
+                            f"GPU情感检测器初始化失败 ({self.emotion_model_type}): {init_e}\n回退到简单模式")
                         return self.process_simple_detection(frame)
             
         except Exception as e:
-            self.log(f"面部识别处理错误: {e}")
+            self._log_face_error(f"面部识别处理错误: {e}", with_traceback=False)
         
         return frame, expressions
     
+    def _log_face_error(self, message, with_traceback=True):
+        """记录面部识别错误，每2秒最多一次，避免逐帧出错时刷屏拖慢界面"""
+        now = time.monotonic()
+        if now - self._last_face_error_time < 2.0:
+            return
+        self._last_face_error_time = now
+        
+        self.log(message)
+        if with_traceback:
+            # 只在实际记录时才格式化调用栈
+            import traceback
+            self.log(f"详细错误信息: {traceback.format_exc()}")
+    
     def process_simple_detection(self, frame):
         """简单的面部检测处理（作为GPU模式的后备）"""
-        expressions = {
-            'angry': 0.0,      # 愤怒
-            'disgust': 0.0,    # 厌恶
-            'fear': 0.0,       # 恐惧
-            'happy': 0.0,      # 高兴
-            'sad': 0.0,        # 伤心
-            'surprise': 0.0,   # 惊讶
-            'neutral': 0.0     # 中立
-        }
+        expressions = dict.fromkeys(EXPR_KEYS, 0.0)
         
         try:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-            faces = face_cascade.detectMultiScale(gray, 1.1, 4, minSize=(100, 100))
+            faces = self._detect_faces(frame)
             
             # 绘制面部框和更新表情数据
             for (x, y, w, h) in faces:
@@ -2238,10 +2528,21 @@ class VRChatOSCGUI:
                 self.face_detection_running = False
                 self.face_detection_btn.config(text=self.get_text("start_face_detection"), state="disabled")
             
+            # 停止画面刷新
+            if self._video_pump_id is not None:
+                self.root.after_cancel(self._video_pump_id)
+                self._video_pump_id = None
+            
             # 等待线程结束
             if self.camera_thread and self.camera_thread.is_alive():
                 self.camera_thread.join(timeout=2)
             
+            # 等待正在进行的识别完成，避免释放检测器时仍在使用
+            if self._detect_future is not None:
+                concurrent.futures.wait([self._detect_future], timeout=2)
+                self._detect_future = None
+            self._pending_image = None
+            
             # 释放摄像头
             if self.camera:
                 self.camera.release()
@@ -2260,7 +2561,9 @@ class VRChatOSCGUI:
             self.camera_start_btn.config(text=self.get_text("start_camera"))
             self.capture_btn.config(state="disabled")
             self.save_expression_btn.config(state="disabled")
-            self.video_label.config(image="", text=self.get_text("click_to_start"))
+            self.video_canvas.itemconfig(self._video_item, state=tk.HIDDEN)
+            self.video_canvas.itemconfig(self._video_text_item, text=self.get_text("click_to_start"), state=tk.NORMAL)
+            self._video_shown = False
             
             self.log(self.get_text("camera_stopped"))
             
@@ -2278,30 +2581,74 @@ class VRChatOSCGUI:
             self.log(f"停止面部识别错误: {e}")
     
     
-    def update_video_display(self, photo):
+    def update_video_display(self, img):
         """更新视频显示（在主线程中调用）"""
         try:
-            if self.camera_running and photo:
-                self.video_label.config(image=photo, text="")
-                self.video_label.image = photo  # 保持引用防止垃圾回收
-            else:
+            if self.camera_running and img is not None:
+                photo = self._video_photo
+                if photo is None or (photo.width(), photo.height()) != img.size:
+                    # 首帧或尺寸变化时才创建新的PhotoImage
+                    self._video_photo = ImageTk.PhotoImage(img)
+                    self.video_canvas.itemconfig(self._video_item, image=self._video_photo)
+                else:
+                    photo.paste(img)
+                
+                if not self._video_shown:
+                    self.video_canvas.itemconfig(self._video_item, state=tk.NORMAL)
+                    self.video_canvas.itemconfig(self._video_text_item, state=tk.HIDDEN)
+                    self._video_shown = True
+            else:
                 self.log("显示更新失败: 摄像头未运行或照片为空")
         except Exception as e:
             self.log(f"更新显示错误: {e}")
             print(f"更新显示错误: {e}")
     
     
+    def _schedule_expr_flush(self):
+        """调度一次表情显示刷新，同一刷新周期内的多次更新只会重绘一次"""
+        if self._expr_flush_scheduled:
+            return
+        self._expr_flush_scheduled = True
+        self.root.after(self._expr_flush_delay, self._flush_expr)
+
+    def _flush_expr(self):
+        """刷新最新的表情数据（在主线程中调用）"""
+        self._expr_flush_scheduled = False
+        expressions = self._pending_expr
+        self._pending_expr = None
+        if expressions is None:
+            return
+        
+        start = time.perf_counter()
+        if self._ui_visible:
+            self._update_expression_display(expressions)
+        else:
+            # 窗口最小化时不重绘界面，但仍需把表情发送到VRChat
+            self.send_expressions_to_vrchat(expressions)
+        
+        # 根据最近的平均刷新耗时调整调度延迟，使整体刷新率保持在约30FPS
+        costs = self._expr_flush_costs
+        costs.append(time.perf_counter() - start)
+        avg = sum(costs) / len(costs)
+        self._expr_flush_delay = max(1, int((1 / 30 - avg) * 1000))
+
     def _update_expression_display(self, expressions):
         """更新表情显示（在主线程中调用）"""
         try:
+            last_values = self._last_expr_values
             for expr_name, value in expressions.items():
                 if expr_name in self.expression_labels:
-                    # 更新数值显示
-                    self.expression_labels[expr_name].config(text=f"{value:.2f}")
-                    
-                    # 更新进度条
                     progress_value = min(100, max(0, value * 100))
-                    self.expression_progress_bars[expr_name]['value'] = progress_value
+
+                    # 变化不足1%时跳过重绘
+                    last_value = last_values.get(expr_name)
+                    if last_value is not None and abs(progress_value - last_value) < 1.0:
+                        continue
+                    last_values[expr_name] = progress_value
+
+                    # 更新数值显示和进度条
+                    self.expression_text_vars[expr_name].set(f"{value:.2f}")
+                    self.expression_vars[expr_name].set(progress_value)
             
             # 更新整体情感状态
             self._update_overall_status(expressions)
@@ -2316,40 +2663,24 @@ class VRChatOSCGUI:
         """更新整体情感状态显示"""
         try:
             if hasattr(self, 'overall_status_label') and hasattr(self, 'overall_status_progress'):
-                # 找出最强的情感（排除中立）
-                non_neutral_expressions = {k: v for k, v in expressions.items() if k != 'neutral'}
+                # 按固定顺序取值，中立位于最后，一次argmax找出最强的非中立情感
+                values = _expression_array(expressions)
+                idx = int(values[:-1].argmax())
+                intensity = float(values[idx])
                 
-                if non_neutral_expressions:
-                    # 获取最强情感
-                    dominant_emotion = max(non_neutral_expressions.items(), key=lambda x: x[1])
-                    emotion_name, intensity = dominant_emotion
-                    
-                    # 如果最强情感的强度很低，显示中立状态
-                    if intensity < 0.1:
-                        display_name = self.get_text("neutral")
-                        display_intensity = expressions.get('neutral', 0.0)
-                    else:
-                        # 情感名称映射
-                        emotion_names = {
-                            'angry': '愤怒',
-                            'disgust': '厌恶',
-                            'fear': '恐惧',
-                            'happy': '高兴',
-                            'sad': '伤心',
-                            'surprise': '惊讶',
-                            'neutral': '中立'
-                        }
-                        display_name = emotion_names.get(emotion_name, emotion_name)
-                        display_intensity = intensity
+                # 如果最强情感的强度很低（包括全为0），显示中立状态
+                if intensity < 0.1:
+                    display_intensity = float(values[-1])
+                    status_text = f"{self.get_text('neutral')} ({display_intensity:.2f})"
                 else:
-                    # 所有情感都为0，显示中立
-                    display_name = self.get_text("neutral")
-                    display_intensity = expressions.get('neutral', 0.0)
+                    # 使用预先格式化的状态文本模板
+                    display_intensity = intensity
+                    status_text = self._overall_status_fmt[EXPR_KEYS[idx]].format(intensity)
                 
                 # 更新显示
-                self.overall_status_label.config(text=f"{display_name} ({display_intensity:.2f})")
+                self.overall_status_label.config(text=status_text)
                 progress_value = min(100, max(0, display_intensity * 100))
-                self.overall_status_progress['value'] = progress_value
+                self.overall_status_var.set(progress_value)
                 
         except Exception as e:
             print(f"更新整体状态错误: {e}")
@@ -2358,28 +2689,23 @@ class VRChatOSCGUI:
         """将表情数据发送到VRChat OSC"""
         try:
             if self.client and self.is_connected and hasattr(self.client, 'osc_client'):
-                # VRChat表情参数映射 - 7种标准情感
-                vrchat_params = {
-                    'angry': '/avatar/parameters/FaceAngry',
-                    'disgust': '/avatar/parameters/FaceDisgust',
-                    'fear': '/avatar/parameters/FaceFear',
-                    'happy': '/avatar/parameters/FaceHappy',
-                    'sad': '/avatar/parameters/FaceSad',
-                    'surprise': '/avatar/parameters/FaceSurprise',
-                    'neutral': '/avatar/parameters/FaceNeutral'
-                }
+                # 一次性把所有值限制在0-1范围内
+                values = _expression_array(expressions)
+                np.clip(values, 0.0, 1.0, out=values)
                 
-                # 发送每个表情参数
-                for expr_name, value in expressions.items():
-                    if expr_name in vrchat_params:
-                        param_address = vrchat_params[expr_name]
-                        # 确保值在0-1范围内
-                        clamped_value = max(0.0, min(1.0, value))
-                        self.client.osc_client.send_parameter(param_address, clamped_value)
+                # 只发送相对上次发送值变化超过0.01的参数，新连接后首帧全部发送
+                last_sent = self._last_sent_expr
+                if last_sent is None:
+                    last_sent = self._last_sent_expr = np.full_like(values, np.inf)
+                changed = np.flatnonzero(np.abs(values - last_sent) > 0.01)
+                
+                send_parameter = self.client.osc_client.send_parameter
+                for i in changed.tolist():
+                    send_parameter(VRCHAT_EXPR_ADDRESSES[i], float(values[i]))
+                    last_sent[i] = values[i]
                         
         except Exception as e:
             # 静默处理错误，避免日志过多
-            import time
             current_time = time.time()
             if hasattr(self, 'last_expression_error_time'):
                 # 只每10秒记录一次错误
@@ -2398,11 +2724,11 @@ class VRChatOSCGUI:
                 timestamp = time.strftime("%Y%m%d_%H%M%S")
                 filename = f"face_capture_{timestamp}.png"
                 
-                # 保存截图
-                cv2.imwrite(filename, self.current_frame)
-                
-                messagebox.showinfo("截图成功", f"截图已保存为: {filename}")
-                self.log(f"截图已保存: {filename}")
+                # 复制当前帧后在后台线程池中编码保存，完成后回到主线程提示
+                frame = self.current_frame.copy()
+                future = self._io_pool.submit(cv2.imwrite, filename, frame)
+                future.add_done_callback(
+                    lambda future: self._post_to_ui(self._on_screenshot_saved, future, filename))
             else:
                 messagebox.showwarning("警告", "没有可用的画面进行截图")
                 
@@ -2410,6 +2736,20 @@ class VRChatOSCGUI:
             messagebox.showerror("截图错误", f"截图失败: {e}")
             self.log(f"截图错误: {e}")
     
+    def _on_screenshot_saved(self, future, filename):
+        """截图保存完成（在主线程中调用）"""
+        if future.cancelled():
+            return
+        
+        error = future.exception()
+        if error is not None or not future.result():
+            messagebox.showerror("截图错误", f"截图失败: {error or filename}")
+            self.log(f"截图错误: {error or filename}")
+            return
+        
+        messagebox.showinfo("截图成功", f"截图已保存为: {filename}")
+        self.log(f"截图已保存: {filename}")
+    
     def save_expression_data(self):
         """保存当前表情数据"""
         try:
@@ -2417,41 +2757,28 @@ class VRChatOSCGUI:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"expression_data_{timestamp}.txt"
             
-            # 保存表情数据
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write("VRChat OSC 表情数据导出\n")
-                f.write(f"时间戳: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 40 + "\n\n")
-                
-                f.write("当前表情参数:\n")
-                for expr_name, value in self.expressions.items():
-                    display_name = {
-                        'angry': '愤怒',
-                        'disgust': '厌恶',
-                        'fear': '恐惧', 
-                        'happy': '高兴',
-                        'sad': '伤心',
-                        'surprise': '惊讶',
-                        'neutral': '中立'
-                    }.get(expr_name, expr_name)
-                    
-                    f.write(f"  {display_name}: {value:.3f}\n")
-                
-                f.write("\nVRChat OSC 参数地址:\n")
-                vrchat_params = {
-                    'angry': '/avatar/parameters/FaceAngry',
-                    'disgust': '/avatar/parameters/FaceDisgust',
-                    'fear': '/avatar/parameters/FaceFear',
-                    'happy': '/avatar/parameters/FaceHappy',
-                    'sad': '/avatar/parameters/FaceSad',
-                    'surprise': '/avatar/parameters/FaceSurprise',
-                    'neutral': '/avatar/parameters/FaceNeutral'
-                }
-                
-                for expr_name, value in self.expressions.items():
-                    if expr_name in vrchat_params:
-                        param_address = vrchat_params[expr_name]
-                        f.write(f"  {param_address}: {value:.3f}\n")
+            # 先拼接完整内容
+            parts = [
+                "VRChat OSC 表情数据导出\n",
+                f"时间戳: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+                "=" * 40 + "\n\n",
+                "当前表情参数:\n",
+            ]
+            for expr_name, value in self.expressions.items():
+                display_name = EXPR_DISPLAY_NAMES.get(expr_name, expr_name)
+                parts.append(f"  {display_name}: {value:.3f}\n")
+            
+            parts.append("\nVRChat OSC 参数地址:\n")
+            for expr_name, value in self.expressions.items():
+                param_address = VRCHAT_EXPR_PARAMS.get(expr_name)
+                if param_address is not None:
+                    parts.append(f"  {param_address}: {value:.3f}\n")
+            
+            # 一次写入临时文件后再替换，避免留下写了一半的文件
+            tmp_filename = filename + '.tmp'
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write(''.join(parts))
+            os.replace(tmp_filename, filename)
             
             messagebox.showinfo("保存成功", f"表情数据已保存到: {filename}")
             self.log(f"表情数据已保存: {filename}")
@@ -2479,6 +2806,7 @@ class VRChatOSCGUI:
                     # 获取角色列表
                     speakers_list = self.voicevox_client.get_speakers_list()
                     speaker_names = [speaker['display'] for speaker in speakers_list]
+                    self._speakers_by_display = {speaker['display']: speaker for speaker in speakers_list}
                     
                     # 更新UI（必须在主线程中执行）
                     self.root.after(0, lambda: self.update_voicevox_ui(speaker_names, True))
@@ -2515,14 +2843,13 @@ class VRChatOSCGUI:
                     if last_character in speaker_values:
                         self.voicevox_character_combo.set(last_character)
                         # 设置对应的说话人
-                        for speaker in period_speakers:
-                            if speaker['display'] == last_character:
-                                self.voicevox_client.set_speaker(
-                                    speaker['speaker_id'],
-                                    speaker['name'],
-                                    speaker['style']
-                                )
-                                break
+                        speaker = self._speakers_by_display.get(last_character)
+                        if speaker:
+                            self.voicevox_client.set_speaker(
+                                speaker['speaker_id'],
+                                speaker['name'],
+                                speaker['style']
+                            )
                     else:
                         # 如果上次的角色不在当前期数中，选择第一个
                         self.voicevox_character_combo.set(speaker_values[0])
@@ -2535,11 +2862,11 @@ class VRChatOSCGUI:
                 else:
                     self.voicevox_character_combo['values'] = []
                     
-                self.voicevox_status_label.config(text="已连接", foreground="green")
+                self.voicevox_status_label.config(text="已连接", style="Status.Connected.TLabel")
                 self.voicevox_test_btn.config(state="normal")
             else:
                 self.voicevox_character_combo['values'] = []
-                self.voicevox_status_label.config(text="未连接", foreground="red")  
+                self.voicevox_status_label.config(text="未连接", style="Status.Disconnected.TLabel")  
                 self.voicevox_test_btn.config(state="disabled")
         except Exception as e:
             self.log(f"更新VOICEVOX UI失败: {e}")
@@ -2551,29 +2878,27 @@ class VRChatOSCGUI:
             
         try:
             selected_display = self.voicevox_character_var.get()
-            speakers_list = self.voicevox_client.get_speakers_list()
-            
-            # 找到对应的角色信息
-            for speaker in speakers_list:
-                if speaker['display'] == selected_display:
-                    self.voicevox_client.set_speaker(
-                        speaker['speaker_id'], 
-                        speaker['name'], 
-                        speaker['style']
-                    )
-                    # 保存配置
-                    self.config.set_voicevox_last_selection(
-                        period=self.voicevox_period_var.get(),
-                        character=selected_display,
-                        speaker_id=str(speaker['speaker_id']),
-                        speaker_name=speaker['name'],
-                        speaker_style=speaker['style']
-                    )
-                    self.config.save_config()
-                    self.log(f"切换VOICEVOX角色: {selected_display}")
-                    # 自动加载该角色的语音参数
-                    self.load_voice_params_for_speaker(speaker['name'], speaker['style'])
-                    break
+            
+            # 从连接时缓存的映射中找到对应的角色信息
+            speaker = self._speakers_by_display.get(selected_display)
+            if speaker:
+                self.voicevox_client.set_speaker(
+                    speaker['speaker_id'], 
+                    speaker['name'], 
+                    speaker['style']
+                )
+                # 保存配置
+                self.config.set_voicevox_last_selection(
+                    period=self.voicevox_period_var.get(),
+                    character=selected_display,
+                    speaker_id=str(speaker['speaker_id']),
+                    speaker_name=speaker['name'],
+                    speaker_style=speaker['style']
+                )
+                self.config.save_config()
+                self.log(f"切换VOICEVOX角色: {selected_display}")
+                # 自动加载该角色的语音参数
+                self.load_voice_params_for_speaker(speaker['name'], speaker['style'])
         except Exception as e:
             self.log(f"切换VOICEVOX角色失败: {e}")
     
@@ -2623,29 +2948,39 @@ class VRChatOSCGUI:
         """语速滑块变化回调"""
         speed_value = float(value)
         self.speed_label.config(text=f"{speed_value:.2f}")
-        if self.voicevox_client:
-            self.voicevox_client.set_voice_parameters(speed_scale=speed_value)
+        self._queue_voice_param('speed_scale', speed_value)
     
     def on_pitch_changed(self, value):
         """音高滑块变化回调"""
         pitch_value = float(value)
         self.pitch_label.config(text=f"{pitch_value:.3f}")
-        if self.voicevox_client:
-            self.voicevox_client.set_voice_parameters(pitch_scale=pitch_value)
+        self._queue_voice_param('pitch_scale', pitch_value)
     
     def on_intonation_changed(self, value):
         """抑扬顿挫滑块变化回调"""
         intonation_value = float(value)
         self.intonation_label.config(text=f"{intonation_value:.2f}")
-        if self.voicevox_client:
-            self.voicevox_client.set_voice_parameters(intonation_scale=intonation_value)
+        self._queue_voice_param('intonation_scale', intonation_value)
     
     def on_volume_changed(self, value):
         """音量滑块变化回调"""
         volume_value = float(value)
         self.volume_label.config(text=f"{volume_value:.2f}")
-        if self.voicevox_client:
-            self.voicevox_client.set_voice_parameters(volume_scale=volume_value)
+        self._queue_voice_param('volume_scale', volume_value)
+    
+    def _queue_voice_param(self, key, value):
+        """记录滑块的最新值，拖动停止80毫秒后再统一应用到VOICEVOX"""
+        self._pending_voice_params[key] = value
+        if self._voice_params_after_id is not None:
+            self.root.after_cancel(self._voice_params_after_id)
+        self._voice_params_after_id = self.root.after(80, self._flush_voice_params)
+    
+    def _flush_voice_params(self):
+        """应用合并后的语音参数"""
+        self._voice_params_after_id = None
+        params, self._pending_voice_params = self._pending_voice_params, {}
+        if self.voicevox_client and params:
+            self.voicevox_client.set_voice_parameters(**params)
     
     def on_voice_preset_changed(self, event=None):
         """语音预设变化回调"""
@@ -2675,6 +3010,12 @@ class VRChatOSCGUI:
             self.intonation_label.config(text=f"{params['intonation']:.2f}")
             self.volume_label.config(text=f"{params['volume']:.2f}")
             
+            # 丢弃尚未应用的滑块值，避免覆盖预设
+            if self._voice_params_after_id is not None:
+                self.root.after_cancel(self._voice_params_after_id)
+                self._voice_params_after_id = None
+            self._pending_voice_params.clear()
+            
             # 应用参数到VOICEVOX
             if self.voicevox_client:
                 self.voicevox_client.set_voice_parameters(
@@ -2718,7 +3059,6 @@ class VRChatOSCGUI:
                 self.log(f"语音试听错误: {e}")
         
         # 在后台线程中播放
-        import threading
         threading.Thread(target=preview_in_background, daemon=True).start()
     
     def reset_voice_params(self):
@@ -2752,9 +3092,6 @@ class VRChatOSCGUI:
     def save_voice_params(self):
         """保存语音参数"""
         try:
-            import json
-            import os
-            
             # 获取当前参数
             params = {
                 "speed": self.speed_var.get(),
@@ -2803,9 +3140,6 @@ class VRChatOSCGUI:
     def load_voice_params_for_speaker(self, speaker_name, speaker_style):
         """为指定角色加载保存的语音参数"""
         try:
-            import json
-            import os
-            
             config_file = os.path.join("data", "voice_params.json")
             if not os.path.exists(config_file):
                 return
@@ -2881,10 +3215,8 @@ class VRChatOSCGUI:
                     
                 # 语音播放完成后停止Avatar说话状态
                 if self.avatar_controller.is_avatar_connected():
-                    # 延迟一点时间让语音播放完
-                    def stop_speaking():
-                        self.avatar_controller.stop_speaking()
-                    self.root.after(3000, stop_speaking)  # 3秒后停止
+                    # 延迟一点时间让语音播放完，3秒后停止
+                    self.root.after(0, self._schedule_stop_speaking, 3000)
                     
             except Exception as e:
                 self.log(f"VOICEVOX语音测试出错: {e}")
@@ -2894,6 +3226,18 @@ class VRChatOSCGUI:
         
         threading.Thread(target=test_in_background, daemon=True).start()
     
+    def _schedule_stop_speaking(self, delay_ms):
+        """（主线程）重新调度停止说话定时器，连续的语音只保留最后一个"""
+        if self._stop_speak_after_id is not None:
+            self.root.after_cancel(self._stop_speak_after_id)
+        self._stop_speak_after_id = self.root.after(delay_ms, self._stop_speaking)
+    
+    def _stop_speaking(self):
+        """停止说话定时器到期：重置Avatar说话状态"""
+        self._stop_speak_after_id = None
+        self.avatar_controller.stop_speaking()
+        self.log("Avatar停止说话")
+    
     def synthesize_with_voicevox(self, text):
         """使用VOICEVOX合成并播放文本（用于LLM输出）"""
         if not self.voicevox_enabled_var.get() or not self.voicevox_client or not self.voicevox_connected:
@@ -2920,10 +3264,7 @@ class VRChatOSCGUI:
                     
                     # 语音播放完成后停止Avatar说话状态
                     if self.avatar_controller.is_avatar_connected():
-                        def stop_speaking():
-                            self.avatar_controller.stop_speaking()
-                            self.log("Avatar停止说话")
-                        self.root.after(duration, stop_speaking)
+                        self.root.after(0, self._schedule_stop_speaking, duration)
                 else:
                     self.log("VOICEVOX语音合成失败")
                     # 失败时立即重置Avatar状态
@@ -3011,7 +3352,9 @@ class VRChatOSCGUI:
         list_container = ttk.Frame(list_frame)
         list_container.pack(fill=tk.BOTH, expand=True)
         
-        self.character_listbox = tk.Listbox(list_container)
+        # 列表内容通过listvariable整体赋值，一次Tcl调用完成刷新
+        self._character_rows_var = tk.StringVar(value=())
+        self.character_listbox = tk.Listbox(list_container, listvariable=self._character_rows_var)
         self.character_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.character_listbox.bind('<<ListboxSelect>>', self.on_character_select)
         
@@ -3032,7 +3375,8 @@ class VRChatOSCGUI:
         position_frame = ttk.Frame(list_frame)
         position_frame.pack(fill=tk.X, pady=(2, 0))
         
-        self.position_label = ttk.Label(position_frame, text=f"当前位置: ({self.player_position['x']:.1f}, {self.player_position['y']:.1f}, {self.player_position['z']:.1f})")
+        player_pos = self.avatar_controller.get_player_position()
+        self.position_label = ttk.Label(position_frame, text=f"当前位置: ({player_pos['x']:.1f}, {player_pos['y']:.1f}, {player_pos['z']:.1f})")
         self.position_label.pack(side=tk.LEFT)
         
         # 添加角色框架
@@ -3075,23 +3419,40 @@ class VRChatOSCGUI:
         ttk.Button(button_frame, text=self.get_text("remove_character"), 
                   command=self.remove_character).pack(side=tk.LEFT)
         
-        # 刷新角色列表
+        # 刷新角色列表（新建的列表框需要完整填充一次）
+        # 之后由update_player_position在位置变化时合并刷新
+        self._character_list_lines = None
+        self._character_list_names = []  # 与列表框各行顺序一致的角色名称
+        self._character_row_source = None  # 生成行前缀时所用的坐标数组
+        self._character_row_prefixes = []  # 每个角色的 "名称 - (x, y, z)" 前缀
         self.refresh_character_list()
-        
-        # 启动距离更新线程
-        if not hasattr(self, 'distance_update_running'):
-            self.distance_update_running = True
-            threading.Thread(target=self.distance_update_loop, daemon=True).start()
     
     def refresh_character_list(self):
         """刷新角色列表"""
-        if not hasattr(self, 'character_listbox'):
+        # 角色管理窗口未打开或已关闭时无需刷新
+        if self.character_listbox is None or not self.character_listbox.winfo_exists():
             return
             
-        self.character_listbox.delete(0, tk.END)
-        for name, pos in self.vrc_characters.items():
-            distance = self.calculate_distance(self.player_position, pos)
-            self.character_listbox.insert(tk.END, f"{name} - ({pos['x']:.1f}, {pos['y']:.1f}, {pos['z']:.1f}) - {distance:.2f}m")
+        # 坐标和距离由角色管理器向量化计算并缓存，与距离文本显示共用
+        names, positions, distances = self.avatar_controller.character_manager.get_distance_snapshot()
+        
+        # 名称和坐标部分只在角色数据变化（坐标数组被重建）时重新格式化，玩家移动时只拼接距离
+        if positions is not self._character_row_source:
+            self._character_row_source = positions
+            self._character_row_prefixes = [f"{name} - ({x:.1f}, {y:.1f}, {z:.1f})"
+                                            for name, (x, y, z) in zip(names, positions.tolist())]
+        lines = [f"{prefix} - {distance:.2f}m"
+                 for prefix, distance in zip(self._character_row_prefixes, distances.tolist())]
+        
+        # 内容未变化时不更新列表，否则整体替换所有行
+        if lines == self._character_list_lines:
+            return
+        # 整体赋值会保留选中的行号，角色增删后行号可能对应其他角色，需清除选中
+        if names != self._character_list_names:
+            self.character_listbox.selection_clear(0, tk.END)
+        self._character_list_lines = lines
+        self._character_list_names = names
+        self._character_rows_var.set(tuple(lines))
     
     def on_character_select(self, event):
         """角色选择事件"""
@@ -3099,11 +3460,12 @@ class VRChatOSCGUI:
         if not selection:
             return
         
-        character_info = self.character_listbox.get(selection[0])
-        character_name = character_info.split(" - ")[0]
+        # 直接按行号取角色名，无需从显示文本中解析
+        character_name = self._character_list_names[selection[0]]
         
-        if character_name in self.vrc_characters:
-            pos = self.vrc_characters[character_name]
+        characters = self.avatar_controller.character_manager.characters
+        if character_name in characters:
+            pos = characters[character_name]
             self.character_name_entry.delete(0, tk.END)
             self.character_name_entry.insert(0, character_name)
             
@@ -3117,7 +3479,7 @@ class VRChatOSCGUI:
             self.character_z_entry.insert(0, str(pos['z']))
             
             # 更新距离显示
-            distance = self.calculate_distance(self.player_position, pos)
+            distance = self.calculate_distance(self.avatar_controller.get_player_position(), pos)
             self.distance_label.config(text=f"{self.get_text('distance_to').format(name=character_name)}: {distance:.2f}m")
     
     def add_character(self):
@@ -3158,7 +3520,8 @@ class VRChatOSCGUI:
         """更新角色位置"""
         try:
             name = self.character_name_entry.get().strip()
-            if not name or name not in self.vrc_characters:
+            character_manager = self.avatar_controller.character_manager
+            if not name or not character_manager.character_exists(name):
                 messagebox.showwarning(self.get_text("warning"), self.get_text("character_name") + self.get_text("param_name_value_required"))
                 return
             
@@ -3166,9 +3529,9 @@ class VRChatOSCGUI:
             y = float(self.character_y_entry.get() or 0)
             z = float(self.character_z_entry.get() or 0)
             
-            self.vrc_characters[name] = {"x": x, "y": y, "z": z}
-            self.save_character_data()  # 自动保存
+            character_manager.update_character_position(name, x, y, z)  # 自动保存
             self.refresh_character_list()
+            self.update_character_distance_display()
             
             messagebox.showinfo(self.get_text("success"), self.get_text("update_position"))
             self.log(f"{self.get_text('character_name')} {name} {self.get_text('update_position')}: ({x}, {y}, {z})")
@@ -3200,23 +3563,7 @@ class VRChatOSCGUI:
     
     def calculate_distance(self, pos1, pos2):
         """计算3D距离"""
-        dx = pos1['x'] - pos2['x']
-        dy = pos1['y'] - pos2['y']
-        dz = pos1['z'] - pos2['z']
-        return (dx*dx + dy*dy + dz*dz) ** 0.5
-    
-    def distance_update_loop(self):
-        """距离更新循环"""
-        while getattr(self, 'distance_update_running', False):
-            try:
-                # 模拟从VRChat OSC获取玩家位置
-                # 在实际应用中，这里应该从OSC接收玩家位置数据
-                if self.is_connected and hasattr(self, 'character_listbox'):
-                    self.root.after(0, self.refresh_character_list)
-                
-                time.sleep(1)  # 每秒更新一次
-            except Exception:
-                break
+        return self.avatar_controller.character_manager.calculate_distance(pos1, pos2)
     
     def update_player_position(self, x, y, z):
         """更新玩家位置（从OSC调用）"""
@@ -3226,19 +3573,28 @@ class VRChatOSCGUI:
         # 为了兼容性，也保持旧的变量
         self.player_position = {"x": x, "y": y, "z": z}
         
+        # 位置消息可能很密集，100毫秒内的多次更新只刷新一次界面（最多10Hz）
+        if not self._position_refresh_pending:
+            self._position_refresh_pending = True
+            self.root.after(100, self._refresh_position_views)
+    
+    def _refresh_position_views(self):
+        """（主线程）按最新的玩家位置刷新位置、距离显示和角色列表"""
+        self._position_refresh_pending = False
+        pos = self.player_position
+        x, y, z = pos['x'], pos['y'], pos['z']
+        
         # 更新主界面中的位置显示
-        if hasattr(self, 'current_pos_label'):
-            pos_text = f"({x:.2f}, {y:.2f}, {z:.2f})"
-            self.root.after(0, lambda: self.current_pos_label.config(text=pos_text))
+        if self.current_pos_label is not None:
+            self.current_pos_label.config(text=f"({x:.2f}, {y:.2f}, {z:.2f})")
         
         # 更新主界面中的距离显示
-        self.root.after(0, self.update_character_distance_display)
+        self.update_character_distance_display()
         
-        # 更新角色管理窗口中的位置显示
-        if hasattr(self, 'position_label'):
-            self.root.after(0, lambda: self.position_label.config(
-                text=f"当前位置: ({x:.1f}, {y:.1f}, {z:.1f})"
-            ))
+        # 更新角色管理窗口中的位置显示和角色列表
+        if self.position_label is not None and self.position_label.winfo_exists():
+            self.position_label.config(text=f"当前位置: ({x:.1f}, {y:.1f}, {z:.1f})")
+        self.refresh_character_list()
     
     def use_current_position(self):
         """使用当前位置填充坐标输入框"""
@@ -3256,7 +3612,7 @@ class VRChatOSCGUI:
     
     def update_character_distance_display(self):
         """更新角色距离显示"""
-        if not hasattr(self, 'character_distance_text'):
+        if self.character_distance_text is None:
             return
         
         try:
@@ -3269,272 +3625,9 @@ class VRChatOSCGUI:
             self.character_distance_text.insert(tk.END, distance_text)
             self.character_distance_text.config(state='disabled')
         except Exception as e:
-            if hasattr(self, 'log'):
-                self.log(f"更新距离显示失败: {e}")
-    
-    def load_character_data(self):
-        """加载角色数据"""
-        try:
-            import json
-            import os
-            
-            # 创建数据目录
-            os.makedirs(os.path.dirname(self.characters_file), exist_ok=True)
-            
-            if os.path.exists(self.characters_file):
-                with open(self.characters_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.vrc_characters = data.get('characters', {})
-                    self.player_position = data.get('player_position', {"x": 0.0, "y": 0.0, "z": 0.0})
-                    
-                    self.log(f"已加载{len(self.vrc_characters)}个角色数据")
-                    
-                    # 初始化角色距离显示
-                    self.root.after(100, self.update_character_distance_display)
-            else:
-                # 创建空文件
-                self.save_character_data()
-                
-        except Exception as e:
-            self.log(f"加载角色数据失败: {e}")
-    
-    def save_character_data(self):
-        """保存角色数据"""
-        try:
-            import json
-            import os
-            
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self.characters_file), exist_ok=True)
-            
-            data = {
-                'characters': self.vrc_characters,
-                'player_position': self.player_position,
-                'version': '1.0',
-                'updated': time.strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            with open(self.characters_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
-            if hasattr(self, 'log'):
-                self.log(f"已保存{len(self.vrc_characters)}个角色数据")
-                
-        except Exception as e:
-            if hasattr(self, 'log'):
-                self.log(f"保存角色数据失败: {e}")
-    
-    # === AI角色控制方法 ===
-    
-    def create_ai_character(self):
-        """创建AI角色"""
-        name = self.new_ai_name_entry.get().strip()
-        personality = self.ai_personality_var.get()
-        
-        if not name:
-            messagebox.showwarning("警告", "请输入AI角色名称")
-            return
-        
-        if not self.avatar_controller:
-            messagebox.showerror("错误", "Avatar控制器未初始化")
-            return
-        
-        try:
-            success = self.avatar_controller.create_ai_character(name, personality)
-            if success:
-                messagebox.showinfo("成功", f"AI角色 '{name}' 创建成功")
-                self.new_ai_name_entry.delete(0, tk.END)
-                self.refresh_ai_character_list()
-                self.log(f"创建AI角色: {name} (人格: {personality})")
-            else:
-                messagebox.showerror("错误", f"创建AI角色失败 - 角色名称可能已存在")
-        except Exception as e:
-            messagebox.showerror("错误", f"创建AI角色时出错: {e}")
-            self.log(f"创建AI角色错误: {e}")
+            self.log(f"更新距离显示失败: {e}")
     
-    def toggle_ai_character(self):
-        """激活/停用AI角色"""
-        selected_name = self.ai_character_var.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择一个AI角色")
-            return
-        
-        if not self.avatar_controller:
-            messagebox.showerror("错误", "Avatar控制器未初始化")
-            return
-        
-        try:
-            # 检查当前是否有激活的AI角色
-            current_active = self.avatar_controller.get_active_ai_character()
-            
-            if current_active == selected_name:
-                # 停用当前角色
-                success = self.avatar_controller.deactivate_ai_character()
-                if success:
-                    messagebox.showinfo("成功", f"已停用AI角色 '{selected_name}'")
-                    self.log(f"停用AI角色: {selected_name}")
-                else:
-                    messagebox.showerror("错误", "停用AI角色失败")
-            else:
-                # 激活选中的角色
-                success = self.avatar_controller.activate_ai_character(selected_name)
-                if success:
-                    messagebox.showinfo("成功", f"已激活AI角色 '{selected_name}'")
-                    self.log(f"激活AI角色: {selected_name}")
-                else:
-                    messagebox.showerror("错误", "激活AI角色失败")
-            
-            # 更新状态显示
-            self.update_ai_character_status()
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"切换AI角色状态时出错: {e}")
-            self.log(f"切换AI角色状态错误: {e}")
-    
-    def delete_ai_character(self):
-        """删除AI角色"""
-        selected_name = self.ai_character_var.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择要删除的AI角色")
-            return
-        
-        # 确认删除
-        result = messagebox.askyesno("确认删除", f"确定要删除AI角色 '{selected_name}' 吗？")
-        if not result:
-            return
-        
-        if not self.avatar_controller:
-            messagebox.showerror("错误", "Avatar控制器未初始化")
-            return
-        
-        try:
-            success = self.avatar_controller.remove_ai_character(selected_name)
-            if success:
-                messagebox.showinfo("成功", f"已删除AI角色 '{selected_name}'")
-                self.refresh_ai_character_list()
-                self.update_ai_character_status()
-                self.log(f"删除AI角色: {selected_name}")
-            else:
-                messagebox.showerror("错误", "删除AI角色失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"删除AI角色时出错: {e}")
-            self.log(f"删除AI角色错误: {e}")
-    
-    def ai_greet(self):
-        """让AI角色打招呼"""
-        if not self.avatar_controller:
-            messagebox.showerror("错误", "Avatar控制器未初始化")
-            return
-        
-        if not self.avatar_controller.has_active_ai_character():
-            messagebox.showwarning("警告", "没有激活的AI角色")
-            return
-        
-        try:
-            success = self.avatar_controller.make_ai_character_greet()
-            if success:
-                active_name = self.avatar_controller.get_active_ai_character()
-                self.log(f"AI角色 '{active_name}' 执行打招呼")
-            else:
-                messagebox.showerror("错误", "AI角色打招呼失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"AI角色打招呼时出错: {e}")
-            self.log(f"AI角色打招呼错误: {e}")
-    
-    def ai_speak_custom(self):
-        """让AI角色说自定义内容"""
-        text = self.ai_speak_entry.get().strip()
-        
-        if not text:
-            messagebox.showwarning("警告", "请输入要说的内容")
-            return
-        
-        if not self.avatar_controller:
-            messagebox.showerror("错误", "Avatar控制器未初始化")
-            return
-        
-        if not self.avatar_controller.has_active_ai_character():
-            messagebox.showwarning("警告", "没有激活的AI角色")
-            return
-        
-        try:
-            success = self.avatar_controller.make_ai_character_speak(text)
-            if success:
-                active_name = self.avatar_controller.get_active_ai_character()
-                self.log(f"AI角色 '{active_name}' 说话: {text}")
-                self.ai_speak_entry.delete(0, tk.END)  # 清空输入框
-            else:
-                messagebox.showerror("错误", "AI角色说话失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"AI角色说话时出错: {e}")
-            self.log(f"AI角色说话错误: {e}")
-    
-    def refresh_ai_character_list(self):
-        """刷新AI角色列表"""
-        if not self.avatar_controller:
-            return
-        
-        try:
-            # 获取所有AI角色名称
-            ai_characters = self.avatar_controller.get_ai_characters()
-            
-            # 更新下拉框选项
-            self.ai_character_combo['values'] = ai_characters
-            
-            # 如果当前选中的角色不在列表中，清空选择
-            current_selection = self.ai_character_var.get()
-            if current_selection not in ai_characters:
-                self.ai_character_var.set("")
-            
-            # 更新状态显示
-            self.update_ai_character_status()
-            
-        except Exception as e:
-            self.log(f"刷新AI角色列表错误: {e}")
-    
-    def update_ai_character_status(self):
-        """更新AI角色状态显示"""
-        if not hasattr(self, 'active_ai_label') or not self.avatar_controller:
-            return
-        
-        try:
-            active_name = self.avatar_controller.get_active_ai_character()
-            
-            if active_name:
-                status_text = f"当前激活: {active_name}"
-                self.active_ai_label.config(text=status_text, foreground="green")
-                
-                # 更新按钮文本
-                if hasattr(self, 'activate_ai_btn'):
-                    self.activate_ai_btn.config(text="停用")
-                    
-                # 启用行为控制按钮
-                if hasattr(self, 'ai_greet_btn'):
-                    self.ai_greet_btn.config(state="normal")
-                if hasattr(self, 'ai_speak_btn'):
-                    self.ai_speak_btn.config(state="normal")
-                if hasattr(self, 'ai_speak_entry'):
-                    self.ai_speak_entry.config(state="normal")
-            else:
-                status_text = "当前激活: 无"
-                self.active_ai_label.config(text=status_text, foreground="red")
-                
-                # 更新按钮文本
-                if hasattr(self, 'activate_ai_btn'):
-                    self.activate_ai_btn.config(text="激活")
-                    
-                # 禁用行为控制按钮
-                if hasattr(self, 'ai_greet_btn'):
-                    self.ai_greet_btn.config(state="disabled")
-                if hasattr(self, 'ai_speak_btn'):
-                    self.ai_speak_btn.config(state="disabled")
-                if hasattr(self, 'ai_speak_entry'):
-                    self.ai_speak_entry.config(state="disabled")
-                    
-        except Exception as e:
-            self.log(f"更新AI角色状态显示错误: {e}")
+    # === AI角色管理器 ===
     
     def init_single_ai_manager(self):
         """初始化单AI角色管理器"""
@@ -3559,12 +3652,8 @@ class VRChatOSCGUI:
     def on_ai_status_change(self, event_type: str, data: dict):
         """AI状态变化回调"""
         if event_type == "vrc_connected":
-            self.root.after(0, lambda: self.ai_osc_status_label.config(text="已连接", foreground="green"))
-            self.root.after(0, lambda: self.ai_osc_connect_btn.config(text="断开连接"))
             self.log("AI角色VRC连接成功")
         elif event_type == "vrc_disconnected":
-            self.root.after(0, lambda: self.ai_osc_status_label.config(text="未连接", foreground="red"))
-            self.root.after(0, lambda: self.ai_osc_connect_btn.config(text="连接VRC"))
             self.log("AI角色VRC连接断开")
         elif event_type == "ai_character_created":
             self.log(f"AI角色创建成功: {data.get('name')} (人格: {data.get('personality')})")
@@ -3573,8 +3662,8 @@ class VRChatOSCGUI:
         elif event_type == "ai_deactivated":
             self.log(f"AI角色停用: {data.get('name')}")
         
-        # 更新界面状态
-        self.root.after(0, self.update_ai_character_status)
+        # 更新界面状态（OSC连接标签和按钮也在其中按状态刷新），连续的状态事件合并为一次刷新
+        self.root.after(0, self._debounce, 'ai_status', self.update_ai_character_status)
     
     def on_voice_queue_status_change(self, event_type: str, item):
         """语音队列状态变化回调"""
@@ -3587,8 +3676,8 @@ class VRChatOSCGUI:
         elif event_type == "error":
             self.log(f"语音处理失败: {item.text[:30]}...")
         
-        # 更新语音队列显示
-        self.root.after(0, self.update_voice_queue_display)
+        # 更新语音队列显示，队列状态频繁变化时合并为一次刷新
+        self.root.after(0, self._debounce, 'voice_queue', self.update_voice_queue_display)
     
     # === 单AI角色控制方法 ===
     
@@ -3626,224 +3715,6 @@ class VRChatOSCGUI:
             messagebox.showerror("错误", f"创建AI角色时出错: {e}")
             self.log(f"创建AI角色错误: {e}")
     
-    def toggle_multi_ai_character(self):
-        """激活/停用多实例AI角色"""
-        selected_name = self.ai_character_var.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择一个AI角色")
-            return
-        
-        if not self.multi_ai_manager:
-            messagebox.showerror("错误", "多实例AI管理器未初始化")
-            return
-        
-        try:
-            # 获取角色状态
-            status = self.multi_ai_manager.get_character_status(selected_name)
-            is_active = status.get("ai_active", False)
-            
-            if is_active:
-                # 停用角色
-                success = self.multi_ai_manager.deactivate_ai_character(selected_name)
-                if success:
-                    messagebox.showinfo("成功", f"已停用AI角色 '{selected_name}'")
-                    self.log(f"停用多实例AI角色: {selected_name}")
-                else:
-                    messagebox.showerror("错误", "停用AI角色失败")
-            else:
-                # 激活角色（会自动启动VRC实例如果需要的话）
-                success = self.multi_ai_manager.activate_ai_character(selected_name)
-                if success:
-                    messagebox.showinfo("成功", 
-                        f"已激活AI角色 '{selected_name}'\n\n"
-                        "AI角色现在可以自动说话和做表情了！\n"
-                        "如果VRChat实例还没启动，系统会自动启动它。"
-                    )
-                    self.log(f"激活多实例AI角色: {selected_name}")
-                else:
-                    messagebox.showerror("错误", "激活AI角色失败，请检查VRChat实例状态")
-            
-            # 更新状态显示
-            self.update_multi_ai_character_status()
-            
-        except Exception as e:
-            messagebox.showerror("错误", f"切换AI角色状态时出错: {e}")
-            self.log(f"切换多实例AI角色状态错误: {e}")
-    
-    def delete_multi_ai_character(self):
-        """删除多实例AI角色"""
-        selected_name = self.ai_character_var.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择要删除的AI角色")
-            return
-        
-        # 确认删除
-        result = messagebox.askyesno(
-            "确认删除", 
-            f"确定要删除AI角色 '{selected_name}' 吗？\n\n"
-            "这将同时删除：\n"
-            "• AI角色和其行为逻辑\n"
-            "• 对应的VRChat实例配置\n"
-            "• 正在运行的VRChat客户端进程\n\n"
-            "此操作无法撤销！"
-        )
-        if not result:
-            return
-        
-        if not self.multi_ai_manager:
-            messagebox.showerror("错误", "多实例AI管理器未初始化")
-            return
-        
-        try:
-            success = self.multi_ai_manager.remove_ai_character(selected_name)
-            if success:
-                messagebox.showinfo("成功", f"已完全删除AI角色 '{selected_name}' 及其VRChat实例")
-                self.refresh_multi_ai_character_list()
-                self.update_multi_ai_character_status()
-                self.log(f"删除多实例AI角色: {selected_name}")
-            else:
-                messagebox.showerror("错误", "删除AI角色失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"删除AI角色时出错: {e}")
-            self.log(f"删除多实例AI角色错误: {e}")
-    
-    def multi_ai_greet(self):
-        """让多实例AI角色打招呼"""
-        selected_name = self.ai_character_var.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择一个AI角色")
-            return
-        
-        if not self.multi_ai_manager:
-            messagebox.showerror("错误", "多实例AI管理器未初始化")
-            return
-        
-        try:
-            success = self.multi_ai_manager.make_character_greet(selected_name)
-            if success:
-                self.log(f"多实例AI角色 '{selected_name}' 执行打招呼")
-            else:
-                messagebox.showwarning("警告", f"AI角色 '{selected_name}' 未激活或执行失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"AI角色打招呼时出错: {e}")
-            self.log(f"多实例AI角色打招呼错误: {e}")
-    
-    def multi_ai_speak_custom(self):
-        """让多实例AI角色说自定义内容"""
-        selected_name = self.ai_character_var.get().strip()
-        text = self.ai_speak_entry.get().strip()
-        
-        if not selected_name:
-            messagebox.showwarning("警告", "请选择一个AI角色")
-            return
-        
-        if not text:
-            messagebox.showwarning("警告", "请输入要说的内容")
-            return
-        
-        if not self.multi_ai_manager:
-            messagebox.showerror("错误", "多实例AI管理器未初始化")
-            return
-        
-        try:
-            success = self.multi_ai_manager.make_character_speak(selected_name, text)
-            if success:
-                self.log(f"多实例AI角色 '{selected_name}' 说话: {text}")
-                self.ai_speak_entry.delete(0, tk.END)  # 清空输入框
-            else:
-                messagebox.showwarning("警告", f"AI角色 '{selected_name}' 未激活或执行失败")
-        except Exception as e:
-            messagebox.showerror("错误", f"AI角色说话时出错: {e}")
-            self.log(f"多实例AI角色说话错误: {e}")
-    
-    def refresh_multi_ai_character_list(self):
-        """刷新多实例AI角色列表"""
-        if not self.multi_ai_manager:
-            return
-        
-        try:
-            # 获取所有AI角色名称
-            ai_characters = self.multi_ai_manager.get_ai_character_names()
-            
-            # 更新下拉框选项
-            self.ai_character_combo['values'] = ai_characters
-            
-            # 如果当前选中的角色不在列表中，清空选择
-            current_selection = self.ai_character_var.get()
-            if current_selection not in ai_characters:
-                self.ai_character_var.set("")
-            
-            # 更新状态显示
-            self.update_multi_ai_character_status()
-            
-        except Exception as e:
-            self.log(f"刷新多实例AI角色列表错误: {e}")
-    
-    def update_multi_ai_character_status(self):
-        """更新多实例AI角色状态显示"""
-        if not hasattr(self, 'active_ai_label') or not self.multi_ai_manager:
-            return
-        
-        try:
-            selected_name = self.ai_character_var.get().strip()
-            
-            if selected_name:
-                status = self.multi_ai_manager.get_character_status(selected_name)
-                is_active = status.get("ai_active", False)
-                vrc_status = status.get("vrc_instance", {}).get("status", "unknown")
-                
-                if is_active:
-                    status_text = f"当前选择: {selected_name} (已激活, VRC: {vrc_status})"
-                    self.active_ai_label.config(text=status_text, foreground="green")
-                    
-                    # 更新按钮文本
-                    if hasattr(self, 'activate_ai_btn'):
-                        self.activate_ai_btn.config(text="停用")
-                        
-                    # 启用行为控制按钮
-                    if hasattr(self, 'ai_greet_btn'):
-                        self.ai_greet_btn.config(state="normal")
-                    if hasattr(self, 'ai_speak_btn'):
-                        self.ai_speak_btn.config(state="normal")
-                    if hasattr(self, 'ai_speak_entry'):
-                        self.ai_speak_entry.config(state="normal")
-                else:
-                    status_text = f"当前选择: {selected_name} (未激活, VRC: {vrc_status})"
-                    self.active_ai_label.config(text=status_text, foreground="orange")
-                    
-                    # 更新按钮文本
-                    if hasattr(self, 'activate_ai_btn'):
-                        self.activate_ai_btn.config(text="激活")
-                        
-                    # 禁用行为控制按钮
-                    if hasattr(self, 'ai_greet_btn'):
-                        self.ai_greet_btn.config(state="disabled")
-                    if hasattr(self, 'ai_speak_btn'):
-                        self.ai_speak_btn.config(state="disabled")
-                    if hasattr(self, 'ai_speak_entry'):
-                        self.ai_speak_entry.config(state="disabled")
-            else:
-                status_text = "当前激活: 无"
-                self.active_ai_label.config(text=status_text, foreground="red")
-                
-                # 更新按钮文本
-                if hasattr(self, 'activate_ai_btn'):
-                    self.activate_ai_btn.config(text="激活")
-                    
-                # 禁用行为控制按钮
-                if hasattr(self, 'ai_greet_btn'):
-                    self.ai_greet_btn.config(state="disabled")
-                if hasattr(self, 'ai_speak_btn'):
-                    self.ai_speak_btn.config(state="disabled")
-                if hasattr(self, 'ai_speak_entry'):
-                    self.ai_speak_entry.config(state="disabled")
-                    
-        except Exception as e:
-            self.log(f"更新多实例AI角色状态显示错误: {e}")
-    
     # === 新的单AI角色控制方法 ===
     
     def toggle_ai_osc_connection(self):
@@ -3857,8 +3728,7 @@ class VRChatOSCGUI:
             
             if status["vrc_connected"]:
                 # 断开连接
-                self.single_ai_manager.disconnect_from_vrc()
-                messagebox.showinfo("成功", "已断开AI角色VRChat连接")
+                connect_args = None
             else:
                 # 从界面获取连接参数
                 host = self.ai_host_entry.get().strip()
@@ -3878,34 +3748,63 @@ class VRChatOSCGUI:
                     messagebox.showwarning("警告", "发送端口和接收端口不能相同")
                     return
                 
+                connect_args = (host, send_port, receive_port)
+            
+            # 连接/断开涉及网络操作，在后台线程池中执行，期间禁用按钮防止重复点击
+            self.ai_osc_connect_btn.config(state="disabled")
+            if connect_args is None:
+                future = self._io_pool.submit(self.single_ai_manager.disconnect_from_vrc)
+            else:
+                host, send_port, receive_port = connect_args
                 # 使用配置的参数连接VRChat
-                success = self.single_ai_manager.connect_to_vrc(
+                future = self._io_pool.submit(
+                    self.single_ai_manager.connect_to_vrc,
                     host=host,
                     send_port=send_port,
                     receive_port=receive_port
                 )
-                
-                if success:
-                    messagebox.showinfo("成功", 
-                        f"AI角色VRChat连接成功！\n\n"
-                        f"连接地址: {host}:{send_port}/{receive_port}\n"
-                        f"现在可以发送文本和语音消息了"
-                    )
-                    self.log(f"AI角色VRC连接成功: {host}:{send_port}/{receive_port}")
-                else:
-                    messagebox.showerror("错误", 
-                        f"AI角色VRChat连接失败\n\n"
-                        f"请检查：\n"
-                        f"1. AI主机地址 {host} 是否正确\n"
-                        f"2. AI主机上的VRChat是否开启OSC\n"
-                        f"3. 端口 {send_port}/{receive_port} 是否被占用\n"
-                        f"4. 网络连接是否正常"
-                    )
+            future.add_done_callback(
+                lambda future: self._post_to_ui(self._on_ai_osc_toggle_done, future, connect_args))
                     
         except Exception as e:
+            self.ai_osc_connect_btn.config(state="normal")
             messagebox.showerror("错误", f"切换AI角色OSC连接时出错: {e}")
             self.log(f"切换AI角色OSC连接错误: {e}")
     
+    def _on_ai_osc_toggle_done(self, future, connect_args):
+        """AI角色OSC连接/断开完成（在主线程中调用）"""
+        if future.cancelled():
+            return
+        self.ai_osc_connect_btn.config(state="normal")
+        
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("错误", f"切换AI角色OSC连接时出错: {error}")
+            self.log(f"切换AI角色OSC连接错误: {error}")
+            return
+        
+        if connect_args is None:
+            messagebox.showinfo("成功", "已断开AI角色VRChat连接")
+            return
+        
+        host, send_port, receive_port = connect_args
+        if future.result():
+            messagebox.showinfo("成功", 
+                f"AI角色VRChat连接成功！\n\n"
+                f"连接地址: {host}:{send_port}/{receive_port}\n"
+                f"现在可以发送文本和语音消息了"
+            )
+            self.log(f"AI角色VRC连接成功: {host}:{send_port}/{receive_port}")
+        else:
+            messagebox.showerror("错误", 
+                f"AI角色VRChat连接失败\n\n"
+                f"请检查：\n"
+                f"1. AI主机地址 {host} 是否正确\n"
+                f"2. AI主机上的VRChat是否开启OSC\n"
+                f"3. 端口 {send_port}/{receive_port} 是否被占用\n"
+                f"4. 网络连接是否正常"
+            )
+    
     def toggle_ai_character(self):
         """激活/停用AI角色"""
         if not self.single_ai_manager:
@@ -3923,27 +3822,53 @@ class VRChatOSCGUI:
                 messagebox.showwarning("警告", "请先连接VRChat")
                 return
             
-            if status["ai_active"]:
-                # 停用AI角色
-                success = self.single_ai_manager.deactivate_ai_character()
-                if success:
-                    messagebox.showinfo("成功", "AI角色已停用")
-                else:
-                    messagebox.showerror("错误", "停用AI角色失败")
+            # 激活/停用会向VRChat发送OSC消息，在后台线程池中执行，期间禁用按钮防止重复点击
+            activating = not status["ai_active"]
+            if self.activate_ai_btn is not None:
+                self.activate_ai_btn.config(state="disabled")
+            if activating:
+                future = self._io_pool.submit(self.single_ai_manager.activate_ai_character)
             else:
-                # 激活AI角色
-                success = self.single_ai_manager.activate_ai_character()
-                if success:
-                    messagebox.showinfo("成功", "AI角色已激活！\n\nAI角色现在会自动说话和做表情了")
-                else:
-                    messagebox.showerror("错误", "激活AI角色失败")
+                future = self._io_pool.submit(self.single_ai_manager.deactivate_ai_character)
+            future.add_done_callback(
+                lambda future: self._post_to_ui(self._on_ai_character_toggle_done, future, activating))
                     
         except Exception as e:
+            if self.activate_ai_btn is not None:
+                self.activate_ai_btn.config(state="normal")
             messagebox.showerror("错误", f"切换AI角色状态时出错: {e}")
             self.log(f"切换AI角色状态错误: {e}")
     
+    def _on_ai_character_toggle_done(self, future, activating):
+        """AI角色激活/停用完成（在主线程中调用）"""
+        if future.cancelled():
+            return
+        if self.activate_ai_btn is not None:
+            self.activate_ai_btn.config(state="normal")
+        
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("错误", f"切换AI角色状态时出错: {error}")
+            self.log(f"切换AI角色状态错误: {error}")
+        elif activating:
+            if future.result():
+                messagebox.showinfo("成功", "AI角色已激活！\n\nAI角色现在会自动说话和做表情了")
+            else:
+                messagebox.showerror("错误", "激活AI角色失败")
+        else:
+            if future.result():
+                messagebox.showinfo("成功", "AI角色已停用")
+            else:
+                messagebox.showerror("错误", "停用AI角色失败")
+    
     def ai_send_text_message(self):
         """发送文本消息到VRChat"""
+        # 0.5秒内的重复点击（如双击发送按钮）直接忽略，避免重复发送
+        now = time.monotonic()
+        if now - self._last_ai_send_time < 0.5:
+            return
+        self._last_ai_send_time = now
+        
         text = self.ai_text_entry.get().strip()
         
         if not text:
@@ -3959,6 +3884,7 @@ class VRChatOSCGUI:
             if success:
                 self.log(f"文本消息已发送: {text}")
                 self.ai_text_entry.delete(0, tk.END)
+                self._set_ai_transient_status(f"文本消息已发送: {text[:30]}")
             else:
                 messagebox.showerror("错误", "发送文本消息失败，请检查VRChat连接")
                 
@@ -3992,7 +3918,7 @@ class VRChatOSCGUI:
                 filename = os.path.basename(file_path)
                 self.ai_voice_file_label.config(text=f"已添加: {filename}", foreground="green")
                 self.log(f"语音文件已添加到队列: {filename}")
-                messagebox.showinfo("成功", f"语音文件已添加到播放队列：\n{filename}")
+                self._set_ai_transient_status(f"语音文件已添加到播放队列: {filename}")
             else:
                 messagebox.showerror("错误", "添加语音文件失败")
                 
@@ -4020,7 +3946,7 @@ class VRChatOSCGUI:
             if success:
                 self.log(f"VOICEVOX语音已生成并添加到队列: {text}")
                 self.ai_voicevox_text_entry.delete(0, tk.END)
-                messagebox.showinfo("成功", f"语音已添加到播放队列：\n{text[:50]}...")
+                self._set_ai_transient_status(f"语音已添加到播放队列: {text[:30]}")
             else:
                 messagebox.showerror("错误", "生成语音失败")
                 
@@ -4028,6 +3954,11 @@ class VRChatOSCGUI:
             messagebox.showerror("错误", f"生成语音时出错: {e}")
             self.log(f"生成VOICEVOX语音错误: {e}")
     
+    def _set_ai_transient_status(self, text, ms=3000):
+        """在VRC消息控制区域显示提示，ms毫秒内没有新提示时自动清除"""
+        self.ai_message_status_label.config(text=text)
+        self._debounce('ai_message_status', lambda: self.ai_message_status_label.config(text=""), ms)
+    
     def ai_greet(self):
         """让AI角色打招呼"""
         if not self.single_ai_manager:
@@ -4037,8 +3968,7 @@ class VRChatOSCGUI:
         try:
             success = self.single_ai_manager.make_ai_greet()
             if success:
-                status = self.single_ai_manager.get_status()
-                self.log(f"AI角色 '{status['ai_character_name']}' 执行打招呼")
+                self.log(f"AI角色 '{self.single_ai_manager.ai_character_name}' 执行打招呼")
             else:
                 messagebox.showwarning("警告", "AI角色未激活或执行失败")
                 
@@ -4061,8 +3991,7 @@ class VRChatOSCGUI:
         try:
             success = self.single_ai_manager.make_ai_speak(text)
             if success:
-                status = self.single_ai_manager.get_status()
-                self.log(f"AI角色 '{status['ai_character_name']}' 说话: {text}")
+                self.log(f"AI角色 '{self.single_ai_manager.ai_character_name}' 说话: {text}")
                 self.ai_speak_entry.delete(0, tk.END)
             else:
                 messagebox.showwarning("警告", "AI角色未激活或执行失败")
@@ -4079,95 +4008,98 @@ class VRChatOSCGUI:
         try:
             status = self.single_ai_manager.get_status()
             
-            # 更新激活状态显示
-            if hasattr(self, 'active_ai_label'):
-                if status["ai_character_exists"]:
-                    if status["ai_active"]:
-                        status_text = f"当前角色: {status['ai_character_name']} (已激活)"
-                        self.active_ai_label.config(text=status_text, foreground="green")
-                        
-                        # 更新按钮状态
-                        if hasattr(self, 'activate_ai_btn'):
-                            self.activate_ai_btn.config(text="停用")
-                        
-                        # 启用控制按钮
-                        self._set_ai_controls_state("normal")
-                        
-                    else:
-                        status_text = f"当前角色: {status['ai_character_name']} (未激活)"
-                        self.active_ai_label.config(text=status_text, foreground="orange")
-                        
-                        if hasattr(self, 'activate_ai_btn'):
-                            self.activate_ai_btn.config(text="激活")
-                        
-                        # 部分启用控制按钮（VRC连接相关的可用）
-                        self._set_ai_controls_state("disabled")
-                        
-                else:
-                    status_text = "当前角色: 无"
-                    self.active_ai_label.config(text=status_text, foreground="red")
-                    
-                    if hasattr(self, 'activate_ai_btn'):
-                        self.activate_ai_btn.config(text="激活")
-                    
-                    # 禁用所有控制按钮
-                    self._set_ai_controls_state("disabled")
-            
-            # 更新OSC连接状态显示
-            if hasattr(self, 'ai_osc_status_label'):
-                if status["vrc_connected"]:
-                    self.ai_osc_status_label.config(text="已连接", foreground="green")
-                    if hasattr(self, 'ai_osc_connect_btn'):
-                        self.ai_osc_connect_btn.config(text="断开连接")
+            # 先根据状态算出所有控件应显示的内容
+            if status["ai_character_exists"]:
+                if status["ai_active"]:
+                    status_text = f"当前角色: {status['ai_character_name']} (已激活)"
+                    status_style = "Status.Connected.TLabel"
+                    activate_text = "停用"
+                    controls_state = "normal"  # 启用控制按钮
                 else:
-                    self.ai_osc_status_label.config(text="未连接", foreground="red")
-                    if hasattr(self, 'ai_osc_connect_btn'):
-                        self.ai_osc_connect_btn.config(text="连接VRC")
+                    status_text = f"当前角色: {status['ai_character_name']} (未激活)"
+                    status_style = "Status.Pending.TLabel"
+                    activate_text = "激活"
+                    controls_state = "disabled"
+            else:
+                status_text = "当前角色: 无"
+                status_style = "Status.Disconnected.TLabel"
+                activate_text = "激活"
+                controls_state = "disabled"  # 禁用所有控制按钮
+            
+            if status["vrc_connected"]:
+                osc_text, osc_style, osc_btn_text = "已连接", "Status.Connected.TLabel", "断开连接"
+            else:
+                osc_text, osc_style, osc_btn_text = "未连接", "Status.Disconnected.TLabel", "连接VRC"
+            
+            # 与上次显示的状态相同时不再重复配置控件
+            state = (status_text, status_style, activate_text, controls_state, osc_text, osc_style, osc_btn_text)
+            last = self._last_ai_status
+            if state == last:
+                return
+            self._last_ai_status = state
+            if last is None:
+                last = (None,) * len(state)
+            
+            # 更新激活状态显示
+            if self.active_ai_label is not None:
+                if state[:2] != last[:2]:
+                    self.active_ai_label.config(text=status_text, style=status_style)
+                if activate_text != last[2] and self.activate_ai_btn is not None:
+                    self.activate_ai_btn.config(text=activate_text)
+                if controls_state != last[3]:
+                    self._set_ai_controls_state(controls_state)
+            
+            # 更新OSC连接状态显示（控件在setup_ui中创建，始终存在）
+            if state[4:6] != last[4:6]:
+                self.ai_osc_status_label.config(text=osc_text, style=osc_style)
+            if osc_btn_text != last[6]:
+                self.ai_osc_connect_btn.config(text=osc_btn_text)
             
         except Exception as e:
             self.log(f"更新AI角色状态显示错误: {e}")
     
     def _set_ai_controls_state(self, state):
         """设置AI控制按钮状态"""
-        controls = [
-            'ai_greet_btn', 'ai_speak_btn', 'ai_speak_entry',
-            'ai_send_text_btn', 'ai_text_entry',
-            'ai_upload_voice_btn', 'ai_voicevox_generate_btn', 'ai_voicevox_text_entry'
-        ]
-        
-        for control_name in controls:
-            if hasattr(self, control_name):
-                control = getattr(self, control_name)
-                if hasattr(control, 'config'):
-                    control.config(state=state)
+        for control in self._ai_controls:
+            control.config(state=state)
     
     def update_voice_queue_display(self):
         """更新语音队列显示"""
-        if not hasattr(self, 'ai_voice_queue_text') or not self.single_ai_manager:
+        if self.ai_voice_queue_text is None or not self.single_ai_manager:
             return
         
         try:
             items = self.single_ai_manager.get_voice_queue_items(10)
             
-            display_text = ""
-            for item in items:
-                status_symbol = {
-                    "pending": "⏳",
-                    "processing": "🔄", 
-                    "completed": "✅",
-                    "error": "❌"
-                }.get(item.get("status", "pending"), "❓")
-                
-                display_text += f"{status_symbol} [{item.get('time', '')}] {item.get('text', '')}\n"
+            # 队列项未变化时（空闲时的常见情况）不重新格式化，也不触碰文本控件
+            items_key = tuple((item.get("status", "pending"), item.get("time", ""), item.get("text", ""))
+                              for item in items)
+            if items_key == self._queue_items_key:
+                return
+            self._queue_items_key = items_key
+            
+            lines = [f"{VOICE_QUEUE_STATUS_SYMBOLS.get(status, '❓')} [{time_str}] {text}"
+                     for status, time_str, text in items_key]
+            
+            if not lines:
+                lines = ["队列为空"]
+            
+            shadow = self._queue_shadow
+            if lines == shadow:
+                return
             
-            if not display_text:
-                display_text = "队列为空"
+            # 找出与当前显示内容相同的前缀行数，只重写发生变化的部分
+            same = 0
+            limit = min(len(lines), len(shadow))
+            while same < limit and lines[same] == shadow[same]:
+                same += 1
             
             # 更新文本显示
+            # 删除和插入合并为一次replace调用
             self.ai_voice_queue_text.config(state='normal')
-            self.ai_voice_queue_text.delete(1.0, tk.END)
-            self.ai_voice_queue_text.insert(tk.END, display_text)
+            self.ai_voice_queue_text.replace(f"{same + 1}.0", tk.END, "".join(f"{line}\n" for line in lines[same:]))
             self.ai_voice_queue_text.config(state='disabled')
+            self._queue_shadow = lines
             
         except Exception as e:
             self.log(f"更新语音队列显示错误: {e}")
@@ -4383,8 +4315,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4410,8 +4341,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4436,8 +4366,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4462,8 +4391,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4488,8 +4416,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4514,8 +4441,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4540,8 +4466,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4561,8 +4486,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             
@@ -4583,8 +4507,7 @@ class VRChatOSCGUI:
                 self.log("请先初始化AI角色管理器")
                 return
                 
-            ai_status = self.single_ai_manager.get_status()
-            if not ai_status.get("vrc_connected", False):
+            if not self.single_ai_manager.is_vrc_connected:
                 self.log("请先连接AI角色到VRChat")
                 return
             